@@ -16,6 +16,7 @@
 
 
 import builtins # for MarcamRepr
+import contextlib
 import logging
 import reprlib
 import threading
@@ -78,17 +79,26 @@ def debug_fxn_factory(logger_fxn):
     Args:
         logger_fxn (logging.Logger.{info,debug,warning,error): Logger function
             send info msgs to.  Typically logging.Logger.info
+            If its level is not enabled when a decorated function is called,
+            the function is called directly without formatting any logs.
     """
     # Use module-level DEBUG_FXN_STATE, so state is shared among all modules
     #   that instance this module, and not local to every
     #   instanced debug_fxn_factory.
 
+    # logger and level logger_fxn logs at, so we can skip building the
+    #   (expensive) log strings if that level is not enabled
+    logger = logger_fxn.__self__
+    log_level = getattr(logging, logger_fxn.__name__.upper())
+
     # debug decorator that announces function call/entry and lists args
     def debug_fxn_(func):
         """Function decorator that prints the function name and the arguments
         used in the function call before executing the function
         """
         def func_wrapper(*args, **kwargs):
+            if not logger.isEnabledFor(log_level):
+                return func(*args, **kwargs)
             thread_name = threading.current_thread().name
             DEBUG_FXN_STATE[thread_name] = DEBUG_FXN_STATE.setdefault(thread_name, 0) + 1
             fxn_depth = DEBUG_FXN_STATE[thread_name]
@@ -122,6 +132,19 @@ debug_fxn = debug_fxn_factory(LOGGER.info)
 debug_fxn_debug = debug_fxn_factory(LOGGER.debug)
 
 
+@contextlib.contextmanager
+def suppress_wx_log():
+    """Context manager: disable wx logging (e.g. error dialogs from wx.Image
+    reading files) while inside.
+
+    Same effect as holding a wx.LogNull object, without constructing one.
+    """
+    was_enabled = wx.Log.EnableLogging(False)
+    try:
+        yield
+    finally:
+        wx.Log.EnableLogging(was_enabled)
+
 def floor(num):
     """Simple numerical ceiling function.
 
@@ -15,6 +15,7 @@
 # limitations under the License.
 
 
+import os
 import sys
 import pathlib
 
@@ -54,6 +55,16 @@ elif sys.platform == 'win32':
 else:
     PLATFORM = 'unix'
 
+# Dir for per-window image cache files (written for every image edit).
+#   Override with MARCAM_TMPDIR environment variable, e.g. MARCAM_TMPDIR=/dev/shm
+#   to keep these files in RAM-backed tmpfs instead of on disk.  (Not the
+#   default: tmpfs has no size limit for the undo history, and files left
+#   after a crash would use RAM until reboot.)
+if os.environ.get('MARCAM_TMPDIR', None):
+    IMAGE_CACHE_DIR = pathlib.Path(os.environ['MARCAM_TMPDIR'])
+else:
+    IMAGE_CACHE_DIR = USER_CACHE_DIR
+
 # Determine exe and icon dir, for frozen/nonfrozen
 #   EXE_DIR is the same dir where the executable lives
 if getattr(sys, 'frozen', False) and getattr(sys, '_MEIPASS', False):
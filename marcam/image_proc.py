@@ -228,7 +228,24 @@ def image_autocontrast(wx_image, cutoff=0):
     return wx_image
 
 @debug_fxn
-def image_remap_colormap(wx_image, cmap='viridis'):
+def get_colormap_lut(cmap='viridis'):
+    """Get lookup table for a named colormap
+
+    Args:
+        cmap (string): desired colormap:
+            'viridis' or 'magma' or 'plasma' or 'inferno'
+
+    Returns:
+        (numpy.ndarray): 256x3 uint8 array mapping gray level to RGB
+    """
+    try:
+        lut = colormaps.CMAPS[cmap]
+    except KeyError:
+        raise Exception("Internal Error: unknown colormap")
+    return lut
+
+@debug_fxn
+def image_remap_colormap(wx_image, cmap='viridis', lut=None):
     """Remap colormap to new color map
 
     Intended to give false color to Black and White images.
@@ -237,6 +254,8 @@ def image_remap_colormap(wx_image, cmap='viridis'):
         wx_image (wx.Image): input image
         cmap (string): desired colormap to map image to:
             'viridis' or 'magma' or 'plasma' or 'inferno'
+        lut (numpy.ndarray): optional 256x3 uint8 lookup table from
+            get_colormap_lut().  If given, cmap is only used for logging.
 
     Returns:
         (wx.Image): output image with false color new colormap
@@ -252,16 +271,9 @@ def image_remap_colormap(wx_image, cmap='viridis'):
     #   is grayscale.
     image_data_gray = image_data[::3]
 
-    if cmap == 'viridis':
-        new_image_data = colormaps.VIRIDIS_DATA[image_data_gray].flatten()
-    elif cmap == 'plasma':
-        new_image_data = colormaps.PLASMA_DATA[image_data_gray].flatten()
-    elif cmap == 'magma':
-        new_image_data = colormaps.MAGMA_DATA[image_data_gray].flatten()
-    elif cmap == 'inferno':
-        new_image_data = colormaps.INFERNO_DATA[image_data_gray].flatten()
-    else:
-        raise Exception("Internal Error: unknown colormap")
+    if lut is None:
+        lut = get_colormap_lut(cmap)
+    new_image_data = lut[image_data_gray].flatten()
 
     wx_image = wx.Image(width, height, new_image_data)
 
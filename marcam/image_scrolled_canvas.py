@@ -15,6 +15,7 @@
 # limitations under the License.
 
 
+import contextlib
 import logging
 import pathlib
 import shutil
@@ -202,7 +203,9 @@ class ImageCache:
             img (wx.Image): if present, first image in initialized cache
         """
         self.parent = parent
-        self.cache_dir = pathlib.Path(tempfile.mkdtemp(dir=const.USER_CACHE_DIR))
+        self.cache_dir = pathlib.Path(
+                tempfile.mkdtemp(prefix='marcam-', dir=const.IMAGE_CACHE_DIR)
+                )
         self.cache_unique_id = 0
         self.img_list = None
         self.img_idx = None
@@ -219,17 +222,19 @@ class ImageCache:
         self.img_idx = None
 
     @debug_fxn
-    def initialize(self, img):
+    def initialize(self, img, png_data=None):
         """Create edit history image list and put Image as first member
 
         Args:
             img (wx.Image): Current image
+            png_data (bytes): optional PNG file data of img, to write to
+                cache file instead of encoding img as PNG
         """
         # remove all indicies in list, delete all cache files
         self._remove_indicies()
         # add new and only value to list
         self.img_list = []
-        self._add_new(img)
+        self._add_new(img, png_data=png_data)
 
     @debug_fxn
     def get_current_imgmem(self):
@@ -250,14 +255,44 @@ class ImageCache:
         (img_cache_file, img_cache_lock) = self.img_list[self.img_idx][1]
         readcache_timer = debug_timer.ElTimer()
         with img_cache_lock:
-            readcache_timer.print_ms("get_current_imgcache: waiting for lock: ")
+            readcache_timer.log_ms(
+                    LOGGER.debug, "TIM:get_current_imgcache: waiting for lock: "
+                    )
             readcache_timer.reset()
             with open(img_cache_file, 'rb') as img_cache_fh:
                 img_cache_data = img_cache_fh.read()
-            readcache_timer.print_ms("get_current_imgcache: reading: ")
+            readcache_timer.log_ms(
+                    LOGGER.debug, "TIM:get_current_imgcache: reading: "
+                    )
 
         return img_cache_data
 
+    @debug_fxn
+    def get_current_img_id(self):
+        """Get identifier unique to current Image in list of edit history
+        of images, for the lifetime of this ImageCache.
+
+        Returns:
+            (str): identifier of current image
+        """
+        return str(self.img_list[self.img_idx][1][0])
+
+    @debug_fxn
+    @contextlib.contextmanager
+    def open_current_imgcache(self):
+        """Context manager: open cache file of current Image in list of edit
+        history of images, holding its lock while open.
+
+        Allows streaming cache file data without reading it all into memory.
+
+        Yields:
+            (filehandle): binary read filehandle of PNG image cache file
+        """
+        (img_cache_file, img_cache_lock) = self.img_list[self.img_idx][1]
+        with img_cache_lock:
+            with open(img_cache_file, 'rb') as img_cache_fh:
+                yield img_cache_fh
+
     @debug_fxn
     def replace_endlist_with_new(self, image_new):
         """Remove list after current idx, add new image to end of list,
@@ -337,7 +372,7 @@ class ImageCache:
         self.img_idx = len(self.img_list) - 1
 
     @debug_fxn
-    def _add_new(self, img):
+    def _add_new(self, img, png_data=None):
         # put place holder cache id in place of eventual path to cache file
         cache_file_lock = threading.Lock()
         cache_file_lock.acquire()
@@ -352,7 +387,7 @@ class ImageCache:
         #   cache_file_lock when done
         create_cache_file_task = longtask.Threaded(
                 self._create_cache_file_thread,
-                (img, cache_filepath, cache_file_lock),
+                (img, cache_filepath, cache_file_lock, png_data),
                 self._thread_done,
                 self.parent
                 )
@@ -362,10 +397,16 @@ class ImageCache:
         #   deleted??  Does that make things break?
 
     @debug_fxn
-    def _create_cache_file_thread(self, img, cache_filepath, cache_file_lock):
+    def _create_cache_file_thread(self, img, cache_filepath, cache_file_lock,
+            png_data=None):
         # Lock is already acquired by spawner.  Only need to release it when
         #   done
-        img.SaveFile(str(cache_filepath), wx.BITMAP_TYPE_PNG)
+        if png_data is not None:
+            # already have PNG data for img, skip slow PNG encode
+            with open(cache_filepath, 'wb') as cache_fh:
+                cache_fh.write(png_data)
+        else:
+            img.SaveFile(str(cache_filepath), wx.BITMAP_TYPE_PNG)
         cache_file_lock.release()
 
     @debug_fxn
@@ -408,6 +449,14 @@ class ImageScrolledCanvas(wx.ScrolledCanvas):
         self.img_dc = None
         self.img_dc_div2 = None
         self.img_dc_div4 = None
+        # cached text from get_image_info() for current img_dc
+        self.img_info = None
+        # incremented every time img_dc changes
+        self.img_dc_version = 0
+        # last image from export_to_image() and the export_cache_key()
+        #   it was made with
+        self.export_img = None
+        self.export_img_key = None
         self.img_size_x = 0
         self.img_size_y = 0
         self.is_dragging = False
@@ -471,6 +520,8 @@ class ImageScrolledCanvas(wx.ScrolledCanvas):
         """
         # Shut down ImageCache.  In particular abort any running threads.
         self.img_cache.shutdown()
+        # release (full-size) cached export image
+        self.clear_export_cache()
         super().Close()
 
     @debug_fxn
@@ -542,6 +593,10 @@ class ImageScrolledCanvas(wx.ScrolledCanvas):
         self.img_dc = None
         self.img_dc_div2 = None
         self.img_dc_div4 = None
+        # cached text from get_image_info() for current img_dc
+        self.img_info = None
+        self.img_dc_version += 1
+        self.clear_export_cache()
         self.img_size_x = 0
         self.img_size_y = 0
 
@@ -1705,6 +1760,17 @@ class ImageScrolledCanvas(wx.ScrolledCanvas):
         """
         return self.img_cache.get_current_imgcache()
 
+    @debug_fxn
+    def open_current_img_cachefile(self):
+        """Context manager: open cache file of current Image in list of edit
+        history of images
+
+        Returns:
+            (context manager): yields binary read filehandle of PNG image
+                cache file
+        """
+        return self.img_cache.open_current_imgcache()
+
     @debug_fxn
     def get_current_img(self):
         """Get current Image in list of edit history of images
@@ -1715,13 +1781,27 @@ class ImageScrolledCanvas(wx.ScrolledCanvas):
         return self.img_cache.get_current_imgmem()
 
     @debug_fxn
-    def new_img(self, img):
+    def get_current_img_id(self):
+        """Get identifier unique to the current image, changing whenever
+        the image is changed (including by Undo or Redo).
+
+        Returns:
+            (str or None): identifier of current image, None if no image
+        """
+        if self.has_no_image():
+            return None
+        return self.img_cache.get_current_img_id()
+
+    @debug_fxn
+    def new_img(self, img, png_data=None):
         """Create edit history image list and put Image as first member
 
         Args:
             img (wx.Image): Current image
+            png_data (bytes): optional PNG file data of img, if already
+                available, to use for cache file instead of encoding img
         """
-        self.img_cache.initialize(img)
+        self.img_cache.initialize(img, png_data=png_data)
 
     @debug_fxn
     def set_img_idx(self, idx_set):
@@ -1757,6 +1837,10 @@ class ImageScrolledCanvas(wx.ScrolledCanvas):
                 img,
                 white_bg=white_bg
                 )
+        # new image, so previous image info and export are obsolete
+        self.img_info = None
+        self.img_dc_version += 1
+        self.clear_export_cache()
         self.img_dc_div2 = image_proc.image2memorydc(
                 img.Scale(self.img_size_x/2, self.img_size_y/2),
                 white_bg=white_bg
@@ -1997,15 +2081,37 @@ class ImageScrolledCanvas(wx.ScrolledCanvas):
         #   update wincenter position manually
         self.get_img_wincenter()
 
+    @debug_fxn
+    def clear_export_cache(self):
+        """Release cached image from export_to_image()
+        """
+        self.export_img = None
+        self.export_img_key = None
+
+    @debug_fxn
+    def export_cache_key(self):
+        """Key identifying everything that export_to_image() draws.  If it
+        is unchanged, a previous export can be reused.
+
+        Returns:
+            (tuple): hashable key for current exported contents
+        """
+        return (self.img_dc_version,)
+
     @debug_fxn
     def export_to_image(self):
         """Export current Device Context to wx.Image
 
-        Resulting Image looks as though it were a Window drawn at 100%
+        Resulting Image looks as though it were a Window drawn at 100%.
+        The result is cached and reused until export_cache_key() changes.
 
         Returns:
             (wx.Image): image output
         """
+        export_key = self.export_cache_key()
+        if self.export_img is not None and export_key == self.export_img_key:
+            return self.export_img
+
         # based largely on code posted to wxpython-users by Andrea Gavana 2006-11-08
         size = self.img_dc.GetSize()
 
@@ -2028,6 +2134,9 @@ class ImageScrolledCanvas(wx.ScrolledCanvas):
         mem_dc.SelectObject(wx.NullBitmap)
 
         img = bmp.ConvertToImage()
+
+        self.export_img = img
+        self.export_img_key = export_key
         return img
 
     @debug_fxn
@@ -2072,11 +2181,12 @@ class ImageScrolledCanvas(wx.ScrolledCanvas):
                 )
 
     @debug_fxn
-    def image_remap_colormap(self, cmap='viridis'):
+    def image_remap_colormap(self, cmap='viridis', lut=None):
         """Apply False color colormap to the image currently being shown.
 
         Args:
             cmap (string): the name of the colormap to use to remap the colors
+            lut (numpy.ndarray): optional precomputed lookup table for cmap
         """
         # return early if no image
         if self.has_no_image():
@@ -2092,7 +2202,8 @@ class ImageScrolledCanvas(wx.ScrolledCanvas):
                     image_proc.image_remap_colormap,
                     wx_image_orig,
                     "Image False Color",
-                    cmap
+                    cmap,
+                    lut
                     ),
                 post_thread_fxn=self.image_proc_postthread,
                 progress_title="Processing Image",
@@ -2181,4 +2292,7 @@ class ImageScrolledCanvas(wx.ScrolledCanvas):
         if self.has_no_image():
             return None
 
-        return image_proc.get_image_info(self.img_dc)
+        # image info only changes when img_dc does (init_image, set_no_image)
+        if self.img_info is None:
+            self.img_info = image_proc.get_image_info(self.img_dc)
+        return self.img_info
@@ -61,6 +61,8 @@ class ImageScrolledCanvasMarks(image_scrolled_canvas.ImageScrolledCanvas):
         self.marks = []
         self.marks_num_update_fxn = marks_num_update_fxn
         self.marks_selected = []
+        # incremented every time marks or marks_selected change
+        self.marks_version = 0
         self.mark_dragging = None
         self.mark_dragging_is_sel = None
 
@@ -87,6 +89,7 @@ class ImageScrolledCanvasMarks(image_scrolled_canvas.ImageScrolledCanvas):
 
         self.marks = []
         self.marks_selected = []
+        self.marks_version += 1
 
         # tell parent UI new total marks number
         self._update_mark_total()
@@ -360,6 +363,7 @@ class ImageScrolledCanvasMarks(image_scrolled_canvas.ImageScrolledCanvas):
                             self.marks_selected.append(mark)
                             # marks_selected already in refresh_rect box, so
                             #   no need to refresh them individually.
+                self.marks_version += 1
 
                 # reset all drag info before updating refresh rects
                 self.mouse_left_down = None
@@ -433,6 +437,7 @@ class ImageScrolledCanvasMarks(image_scrolled_canvas.ImageScrolledCanvas):
         # if dragged mark was selected, add to marks_selected too
         if is_selected:
             self.marks_selected.append(to_mark_pt)
+            self.marks_version += 1
         # Finally force a repaint of all invalidated areas
         self.Update()
 
@@ -471,6 +476,7 @@ class ImageScrolledCanvasMarks(image_scrolled_canvas.ImageScrolledCanvas):
             return False
 
         self.marks.append(img_point)
+        self.marks_version += 1
 
         self.refresh_mark_area(img_point)
 
@@ -487,8 +493,22 @@ class ImageScrolledCanvasMarks(image_scrolled_canvas.ImageScrolledCanvas):
         Args:
             point_list (list): list of (x,y) tuples in image coordinates
         """
+        LOGGER.info("MSC: point list, %d points", len(point_list))
+
+        # Add all new points in one pass, checking for duplicates against a
+        #   set instead of searching the marks list once per point.
+        marks_set = set(self.marks)
+        new_marks = []
         for point in point_list:
-            self.mark_point(point, internal=True)
+            if point not in marks_set:
+                marks_set.add(point)
+                new_marks.append(point)
+        self.marks.extend(new_marks)
+
+        # one refresh of the whole window instead of one per mark
+        if new_marks:
+            self.marks_version += 1
+            self.Refresh()
         self._update_mark_total()
         self.Update()
 
@@ -501,6 +521,7 @@ class ImageScrolledCanvasMarks(image_scrolled_canvas.ImageScrolledCanvas):
             internal (bool): Default False.  If true, do NOT Update window
         """
         self.marks_selected.remove(desel_pt)
+        self.marks_version += 1
         self.refresh_mark_area(desel_pt)
         if not internal:
             self.Update()
@@ -529,6 +550,7 @@ class ImageScrolledCanvasMarks(image_scrolled_canvas.ImageScrolledCanvas):
             self.marks_selected.remove(mark_pt)
         except ValueError:
             pass
+        self.marks_version += 1
         self.refresh_mark_area(mark_pt)
         if not internal:
             # tell parent UI new total marks number
@@ -627,6 +649,7 @@ class ImageScrolledCanvasMarks(image_scrolled_canvas.ImageScrolledCanvas):
                 # select this mark
                 self.deselect_all_marks()
                 self.marks_selected = [sel_pt,]
+            self.marks_version += 1
 
             self.refresh_mark_area(sel_pt)
             self.Update()
@@ -642,6 +665,7 @@ class ImageScrolledCanvasMarks(image_scrolled_canvas.ImageScrolledCanvas):
         marks_unselected = [x for x in self.marks if x not in self.marks_selected]
         # copy all marks into marks_selected
         self.marks_selected = self.marks.copy()
+        self.marks_version += 1
         # set all unselected marks for refresh to allow color change
         for mark in marks_unselected:
             self.refresh_mark_area(mark)
@@ -759,6 +783,16 @@ class ImageScrolledCanvasMarks(image_scrolled_canvas.ImageScrolledCanvas):
                             cross_win - const.CROSS_CENTER_COORDS
                             )
 
+    @debug_fxn
+    def export_cache_key(self):
+        """Key identifying everything that export_to_image() draws, including
+        marks and which marks are selected.
+
+        Returns:
+            (tuple): hashable key for current exported contents
+        """
+        return super().export_cache_key() + (self.marks_version,)
+
     @debug_fxn
     def export_draw_to_memdc(self, mem_dc, width, height):
         # Blit (in this case copy) the actual screen on the memory DC
@@ -90,10 +90,8 @@ def can_read_image(image_path):
         # for all other image files
         # wx.Image.CanRead has its own error log, which is setup to cause
         #   error dialog.  Disable it if because want to use our own
-        no_log = wx.LogNull()
-        img_ok = wx.Image.CanRead(str(image_path))
-        # re-enable logging
-        del no_log
+        with common.suppress_wx_log():
+            img_ok = wx.Image.CanRead(str(image_path))
 
     return img_ok
 
@@ -165,6 +163,7 @@ class MarcamApp(wx.App):
         self.config_data = None
         self.last_frame_pos = wx.DefaultPosition
         self.last_falsecolor = 'viridis'
+        self.last_falsecolor_lut = image_proc.get_colormap_lut('viridis')
         self.last_autocontrast_level = 0
 
         # may call MacOpenFiles and add files to self.file_windows and make
@@ -214,9 +213,11 @@ class MarcamApp(wx.App):
         #   requests from possible other instances that run just long enough to
         #   request file(s) be opened by us.
         if const.PLATFORM == 'win':
+            # set on exit so thread stops waiting on pipe
+            self.win_file_quit_event = winpipe.new_quit_event()
             win_file_thread = threading.Thread(
                     target=win_file_receiver,
-                    args=(self,),
+                    args=(self, self.win_file_quit_event),
                     daemon=True,
                     )
             win_file_thread.start()
@@ -258,6 +259,8 @@ class MarcamApp(wx.App):
             cmap (str): string (lower-case) representing the colormap
         """
         self.last_falsecolor = cmap
+        # look up colormap table once here, instead of on every apply
+        self.last_falsecolor_lut = image_proc.get_colormap_lut(cmap)
 
         for frame in self.file_windows.get_list_copy():
             key_accel = frame.tools_imgfcolorlast_item.GetItemLabel().split('\t')[1]
@@ -278,6 +281,16 @@ class MarcamApp(wx.App):
         """
         return self.last_falsecolor
 
+    @debug_fxn
+    def get_last_falsecolor_lut(self):
+        """Get lookup table of "last false color" colormap used in any window
+            for False Color image operation.
+
+        Returns:
+            (numpy.ndarray): 256x3 uint8 array mapping gray level to RGB
+        """
+        return self.last_falsecolor_lut
+
     @debug_fxn
     def on_evt_win_file(self, evt):
         """Event handler for our custom Event receiving Windows file open
@@ -618,6 +631,9 @@ class MarcamApp(wx.App):
         self.file_history.Save(self.wx_config)
         # save config_data right before app is about to exit
         self.write_config()
+        # stop thread receiving filenames from other instances
+        if const.PLATFORM == 'win':
+            winpipe.set_quit_event(self.win_file_quit_event)
         return super().OnExit()
 
 
@@ -720,16 +736,21 @@ def another_instance_running(srcfile_args):
     return another_inst
 
 @debug_fxn
-def win_file_receiver(wx_app):
+def win_file_receiver(wx_app, quit_event):
     """
     Only to be used on Windows
+
+    Args:
+        wx_app (wx.App): app to post open-file events to
+        quit_event (PyHANDLE): event from winpipe.new_quit_event(), set to
+            stop receiving
     """
     def string_read_fxn(read_str):
         # post as an Event to App, so it can open filenames we receive
         wx.PostEvent(wx_app, myWinFileEvent(open_filename=read_str))
 
-    # for as long as this thread lives, wait for clients to write to pipe
-    winpipe.server_pipe_read(WIN_FILE_PIPE_NAME, string_read_fxn)
+    # until quit_event is set, wait for clients to write to pipe
+    winpipe.server_pipe_read(WIN_FILE_PIPE_NAME, string_read_fxn, quit_event)
 
 @debug_fxn
 def sanity_checks():
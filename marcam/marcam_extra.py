@@ -35,12 +35,29 @@ LOGGER.addHandler(logging.NullHandler())
 
 # create debug function using this file's logger
 debug_fxn = common.debug_fxn_factory(LOGGER.info)
-debug_fxn_debug = common.debug_fxn_factory(LOGGER)
+debug_fxn_debug = common.debug_fxn_factory(LOGGER.debug)
 
 
 STDERR_STR = "STDERR: "
 
 
+@debug_fxn
+def error_dialog(parent, caption, message, style=wx.OK | wx.ICON_EXCLAMATION):
+    """Show modal error message dialog, destroying it when dismissed.
+
+    Args:
+        parent (wx.Window or None): parent window
+        caption (str): title of dialog
+        message (str): error message text
+        style (int): wx.MessageDialog style flags
+            (wx.ICON_ERROR has no effect on Mac, so default is
+            wx.ICON_EXCLAMATION)
+    """
+    with wx.MessageDialog(
+            parent, message=message, caption=caption, style=style
+            ) as message_dialog:
+        message_dialog.ShowModal()
+
 @debug_fxn
 def file_unable_to_open_dialog(parent, img_path):
     """Common code whenever a file is not valid to be opened.
@@ -50,11 +67,30 @@ def file_unable_to_open_dialog(parent, img_path):
         img_path (str): path to image file that was invalid
     """
     LOGGER.warning("Unable to open file: %s", img_path)
-    wx.MessageDialog(parent,
-            message="Unable to open file: %s"%img_path,
-            caption="File Read Error",
-            style=wx.OK | wx.ICON_EXCLAMATION
-            ).ShowModal()
+    error_dialog(parent, "File Read Error", "Unable to open file: %s"%img_path)
+
+@debug_fxn
+def file_not_found_dialog(parent, img_path):
+    """Common code whenever a file to be opened does not exist.
+
+    Args:
+        parent (wx.Window or None): parent window
+        img_path (str): path to image file that was not found
+    """
+    error_dialog(
+            parent, "File Not Found", "Unable to find file: %s"%img_path,
+            style=wx.OK
+            )
+
+@debug_fxn
+def file_unable_to_save_dialog(parent, img_path):
+    """Common code whenever a file could not be saved.
+
+    Args:
+        parent (wx.Window or None): parent window
+        img_path (str): path to file that could not be saved
+    """
+    error_dialog(parent, "File Write Error", "Unable to save file: %s"%img_path)
 
 
 class StderrToLog:
@@ -279,6 +315,8 @@ class EditHistory():
         self.history_nodes = None
         self.history_node_i = None
         self.history_edges = None
+        # cached result of get_changes_summary(), None when out of date
+        self.changes_summary = None
 
         # (node0) - edge0 - (node1) - edge1 - (node2) - edge2 - (node3)
         # edgeN connects nodeN and nodeN+1
@@ -295,6 +333,7 @@ class EditHistory():
         # one edge connects two nodes, an action that transforms previous
         #   node to next node
         self.history_edges = []
+        self.changes_summary = None
 
         # update Save, Redo, Undo menu items
         self._update_menu_items()
@@ -327,6 +366,7 @@ class EditHistory():
                     }
                 )
         self.history_node_i = len(self.history_nodes) - 1
+        self.changes_summary = None
 
         # update Save, Redo, Undo menu items
         self._update_menu_items()
@@ -345,6 +385,7 @@ class EditHistory():
 
         # set current edit history node save flag to True
         self.history_nodes[self.history_node_i]['save_flag'] = True
+        self.changes_summary = None
 
         # update Save, Redo, Undo menu items
         self._update_menu_items()
@@ -370,6 +411,7 @@ class EditHistory():
         if self._can_undo():
             undo_action = self.history_edges[self.history_node_i - 1]['edit_action']
             self.history_node_i -= 1
+            self.changes_summary = None
         else:
             undo_action = None
 
@@ -388,6 +430,7 @@ class EditHistory():
         if self._can_redo():
             redo_action = self.history_edges[self.history_node_i]['edit_action']
             self.history_node_i += 1
+            self.changes_summary = None
         else:
             redo_action = None
 
@@ -441,6 +484,32 @@ class EditHistory():
 
         return (edits_since_save_new, never_saved)
 
+    @debug_fxn
+    def get_changes_summary(self):
+        """Return a bulleted summary string of actions since last save,
+        suitable for a "Save changes?" dialog.
+
+        Only the first 3 changes are listed (plus a "[N more...]" entry).
+        The result is cached until the history changes, so repeated queries
+        (e.g. a cancelled close followed by another close) do no work.
+
+        Returns:
+            (str, bool): (bulleted list of changes since last save, or "" if
+                none, True if file was never saved)
+        """
+        if self.changes_summary is None:
+            (changes_list, never_saved) = self.get_actions_since_save()
+            if changes_list:
+                if len(changes_list) > 4:
+                    extra_str = "[%d more...]"%(len(changes_list) - 3)
+                    changes_list = changes_list[:3] + [extra_str,]
+                changes_str = "\n".join(["    \u2022 "+x for x in changes_list])
+            else:
+                changes_str = ""
+            self.changes_summary = (changes_str, never_saved)
+
+        return self.changes_summary
+
     @debug_fxn
     def _can_undo(self):
         """Is there an action to undo back in history?
@@ -713,6 +782,22 @@ class HelpFrame(wx.Frame):
         self.SetTitle("Marcam Help")
         self.SetSize((500, 600))
 
+        self.Bind(wx.EVT_CLOSE, self.on_evt_close)
+
+    @debug_fxn
+    def on_evt_close(self, evt):
+        """EVT_CLOSE Handler: hide instead of destroying window if possible,
+        so it can be quickly shown again
+
+        Args:
+            evt (wx.CloseEvent): obj returned from EVT_CLOSE
+        """
+        if evt.CanVeto():
+            evt.Veto()
+            self.Hide()
+        else:
+            self.Destroy()
+
 
 class FrameList():
     """Manager for all top-level Frames in Marcam App.
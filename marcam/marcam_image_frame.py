@@ -18,13 +18,17 @@
 # GUI for displaying an image and counting cells
 
 
+import contextlib
 from datetime import datetime
+import functools
 import json
 import logging
+import os
 import pathlib
 import platform
 import re
 import sys
+import time
 
 import wx
 import wx.adv
@@ -48,6 +52,125 @@ LOGGER.addHandler(logging.NullHandler())
 debug_fxn = common.debug_fxn_factory(LOGGER.info)
 debug_fxn_debug = common.debug_fxn_factory(LOGGER.debug)
 
+# extracts "*.bmp;*.png;..." from inside parentheses of wx image wildcard
+IMAGE_EXTS_RE = re.compile(r"\(([^)]+)\)")
+# seconds that cached path-exists results are valid for
+PATH_EXISTS_TTL = 2.0
+
+
+@functools.lru_cache(maxsize=1)
+def _image_wildcard_exts():
+    """Get wx wildcard string for all readable image types, and the list of
+    extensions it contains.  wx's list does not change while we are running,
+    so compute it only once.
+
+    Returns:
+        (str, str): (wx image wildcard string, semicolon-separated list of
+            image extensions e.g. "*.bmp;*.png")
+    """
+    image_wildcards = wx.Image.GetImageExtWildcard()
+    image_exts = IMAGE_EXTS_RE.search(image_wildcards).group(1)
+    return (image_wildcards, image_exts)
+
+
+@functools.lru_cache(maxsize=64)
+def _path_exists_ttl(path_str, time_bucket):
+    """Cached os.path.exists, keyed on a time bucket so results expire.
+    Use _path_exists_cached() instead of calling this directly.
+
+    Args:
+        path_str (str): path to check for existence
+        time_bucket (int): PATH_EXISTS_TTL-long time interval index
+
+    Returns:
+        bool: True if path exists
+    """
+    return os.path.exists(path_str)
+
+def _path_exists_cached(path_str):
+    """Short-lived cached os.path.exists, so repeated checks of the same path
+    (e.g. from the Open Recent menu) don't stat the filesystem every time.
+    Results are at most PATH_EXISTS_TTL seconds old, so files changed
+    outside of this app are noticed.
+
+    Args:
+        path_str (str): path to check for existence
+
+    Returns:
+        bool: True if path exists
+    """
+    return _path_exists_ttl(path_str, int(time.monotonic() // PATH_EXISTS_TTL))
+
+
+@debug_fxn
+def _read_wx_image_file(img_file):
+    """Read any image file type that wx.Image supports natively.
+
+    Args:
+        img_file (pathlike): path to image file
+
+    Returns:
+        wx.Image: image read from file
+    """
+    # disable logging, we don't care if there is e.g. TIFF image
+    #   with unknown fields
+    with common.suppress_wx_log():
+        img = wx.Image(str(img_file))
+
+    return img
+
+
+@debug_fxn
+@contextlib.contextmanager
+def _clipboard_session():
+    """Context manager for one open/flush/close session of the clipboard, so
+    multiple SetData calls can share one session.
+
+    Yields:
+        wx.Clipboard or None: the open clipboard, or None if it could not
+            be opened
+    """
+    if not wx.TheClipboard.Open():
+        yield None
+        return
+    try:
+        yield wx.TheClipboard
+        # to ensure data stays on clipboard even after app exits
+        #   Necessary for Windows.
+        #   Not necessary for Mac.
+        wx.TheClipboard.Flush()
+    finally:
+        wx.TheClipboard.Close()
+
+
+def _summarize_action(action):
+    """Short description of an edit history action for logging, without
+    repr() of potentially long mark lists.
+
+    (Not decorated with debug_fxn, which would repr the whole action.)
+
+    Args:
+        action (list or None): action from EditHistory undo() or redo()
+
+    Returns:
+        str: compact text describing action
+    """
+    if action is None:
+        return "None"
+    if action[0] == 'DELETE_MARK_LIST':
+        return "%s n=%d"%(action[0], len(action[1]))
+    if action[0] == 'IMAGE_XFORM':
+        return "%s img_idx %d->%d"%(action[0], action[1], action[2])
+    return "%s %s"%(action[0], " ".join(str(x) for x in action[1:]))
+
+
+# image readers for files that wx.Image can't read natively, keyed by
+#   lower-case suffix.  All other suffixes use _read_wx_image_file
+IMAGE_FILE_READERS = {
+        '.1sc': image_proc.file1sc_to_image,
+        }
+
+
 class ImageFrame(wx.Frame):
     """Application Level Frame, one for each open image file.
     """
@@ -60,11 +183,22 @@ class ImageFrame(wx.Frame):
         self.frame_history = marcam_extra.EditHistory()
         self.img_path = None # NONE or pathlib.Path
         self.save_filepath = None # NONE or pathlib.Path
+        # .mcm file path, img_panel image id, and mcmfile.file_signature()
+        #   of image data last loaded from or saved to .mcm file, to know if
+        #   image in file is current.  Only set from GUI thread.
+        self.saved_img_path = None
+        self.saved_img_id = None
+        self.saved_img_sig = None
         self.temp_scroll_zoom_state = None
         self.parent = parent
         self.close_source = None
+        # file loaders keyed by lower-case suffix, any other suffix is
+        #   loaded with self.load_image_from_file
+        self.file_loaders = {
+                '.mcm': self.load_mcmfile_from_path,
+                }
         # make dir for saving cache images of this window
-        const.USER_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        const.IMAGE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
         # GUI-related
         self.html = None
@@ -76,6 +210,16 @@ class ImageFrame(wx.Frame):
         self.toolbar = None
         self.started_temp_zoom = False
         self.menu_items_disable_no_image = None
+        # True if a menu_items_enable_disable is already scheduled by CallAfter
+        self.menu_refresh_pending = False
+        # text of marks total, kept in sync with self.marks_num_display
+        self.marks_total_str = "0"
+        # File dialogs are created on first use and then reused
+        self.open_dialog = None
+        self.saveas_dialog = None
+        self.export_dialog = None
+        # text currently shown in zoom field of statusbar
+        self.zoom_status_str = None
 
         # Debug only
         self.benchzoom_iteration = None
@@ -89,6 +233,30 @@ class ImageFrame(wx.Frame):
         self.init_ui()
         initui_timer.log_ms(LOGGER.debug, "TIM:init_ui: ")
 
+        # Edit History action handlers for Undo and Redo, keyed by action str
+        self.undo_dispatch = {
+                'MARK': lambda action: self.img_panel.delete_mark(
+                    action[1], internal=False
+                    ),
+                'DELETE_MARK_LIST': lambda action: self.img_panel.mark_point_list(
+                    action[1]
+                    ),
+                'MOVE_MARK': lambda action: self.img_panel.move_mark(
+                    action[2], action[1], is_selected=False
+                    ),
+                'IMAGE_XFORM': lambda action: self.image_xform_to_idx(action[1]),
+                }
+        self.redo_dispatch = {
+                'MARK': lambda action: self.img_panel.mark_point(action[1]),
+                'DELETE_MARK_LIST': lambda action: self.img_panel.delete_mark_point_list(
+                    action[1]
+                    ),
+                'MOVE_MARK': lambda action: self.img_panel.move_mark(
+                    action[1], action[2], is_selected=False
+                    ),
+                'IMAGE_XFORM': lambda action: self.image_xform_to_idx(action[2]),
+                }
+
         # On init, we will always have no image, so this just disables
         #   unneeded menus
         self.menu_items_enable_disable()
@@ -499,6 +667,27 @@ class ImageFrame(wx.Frame):
         for item in self.menu_items_disable_no_image:
             item.Enable(enable_state)
 
+    @debug_fxn
+    def schedule_menu_refresh(self):
+        """Schedule menu_items_enable_disable to run after current events are
+        processed.  Multiple requests before then (e.g. opening several files
+        at once) are coalesced into one refresh of the menus.
+        """
+        if self.menu_refresh_pending:
+            return
+        self.menu_refresh_pending = True
+        wx.CallAfter(self.do_menu_refresh)
+
+    @debug_fxn
+    def do_menu_refresh(self):
+        """CallAfter target of schedule_menu_refresh
+        """
+        # frame may have been destroyed since refresh was scheduled
+        if not self:
+            return
+        self.menu_refresh_pending = False
+        self.menu_items_enable_disable()
+
     @debug_fxn
     def marks_num_update(self, mark_total):
         """Update the Total Marks display with argument.  Registered with
@@ -507,7 +696,8 @@ class ImageFrame(wx.Frame):
         Args:
             mark_total (int): number of marks to display in UI
         """
-        self.marks_num_display.SetLabel("%d"%mark_total)
+        self.marks_total_str = "%d"%mark_total
+        self.marks_num_display.SetLabel(self.marks_total_str)
 
     @debug_fxn
     def has_image(self):
@@ -605,6 +795,13 @@ class ImageFrame(wx.Frame):
         else:
             # Normally close window.
 
+            # destroy any file dialogs we have been keeping for reuse
+            for file_dialog in (
+                    self.open_dialog, self.saveas_dialog, self.export_dialog
+                    ):
+                if file_dialog is not None:
+                    file_dialog.Destroy()
+
             winsize = self.GetSize()
             self.parent.config_data['winsize'] = list(winsize)
             # close image panel nicely
@@ -693,7 +890,7 @@ class ImageFrame(wx.Frame):
                         evt.GetPosition()
                         )
                 if zoom:
-                    self.statusbar.SetStatusText("Zoom: %.1f%%"%(zoom*100), 1)
+                    self.set_zoom_status(zoom)
 
                 # indicate we have actually initiated a temp zoom (so we
                 #   don't keep zooming if user holds down temp zoom key
@@ -742,7 +939,7 @@ class ImageFrame(wx.Frame):
                     )
             # update statusbar zoom message
             zoom = self.img_panel.zoom_list[self.temp_scroll_zoom_state[1]]
-            self.statusbar.SetStatusText("Zoom: %.1f%%"%(zoom*100), 1)
+            self.set_zoom_status(zoom)
 
             # indicate end of temp zoom state
             self.started_temp_zoom = False
@@ -797,14 +994,10 @@ class ImageFrame(wx.Frame):
         Args:
             _evt (wx.CommandEvent):
         """
-        marks_total_text = self.marks_num_display.GetLineText(0)
-        if wx.TheClipboard.Open():
-            wx.TheClipboard.SetData(wx.TextDataObject(marks_total_text))
-            # to ensure text stays on clipboard even after app exits
-            #   Necessary for Windows.
-            #   Not necessary for Mac.
-            wx.TheClipboard.Flush()
-            wx.TheClipboard.Close()
+        # use cached marks total string instead of reading from text control
+        with _clipboard_session() as clipboard:
+            if clipboard is not None:
+                clipboard.SetData(wx.TextDataObject(self.marks_total_str))
 
     @debug_fxn
     def on_open(self, _evt):
@@ -813,35 +1006,37 @@ class ImageFrame(wx.Frame):
         Args:
             _evt (wx.CommandEvent):
         """
-        # create wildcard for:
-        #   native *.mcm files
-        #   Image files
-        #   *.1sc files (Bio-Rad)
-        image_wildcards = wx.Image.GetImageExtWildcard()
-        image_exts = re.search(r"\(([^)]+)\)", image_wildcards).group(1)
-        image_exts = "*.mcm;*.1sc;" + image_exts
-
-        # wildcard_all is technically redundant, but is useful for Windows
-        #   which has a pulldown menu filtering for each category of files.
-        #   Thus the first "category" will show all applicable files.
-        wildcard_all = "All openable files (" + image_exts + ")|" + \
-                image_exts + "|"
-        wildcard_mcm = "Marcam Image Data files (*.mcm)|*.mcm|"
-        wildcard_img = "Image Files " + image_wildcards + "|"
-        wildcard_1sc = "Bio-Rad 1sc Files|*.1sc"
-        wildcard = wildcard_all + wildcard_mcm + wildcard_img + wildcard_1sc
-        # native Mac open dialog has no title message
-        open_file_dialog = wx.FileDialog(self,
-                "" if const.PLATFORM == 'mac' else "Open Image file",
-                wildcard=wildcard,
-                style=wx.FD_OPEN | wx.FD_FILE_MUST_EXIST)
-
-        if open_file_dialog.ShowModal() == wx.ID_CANCEL:
+        if self.open_dialog is None:
+            # create wildcard for:
+            #   native *.mcm files
+            #   Image files
+            #   *.1sc files (Bio-Rad)
+            (image_wildcards, image_exts) = _image_wildcard_exts()
+            image_exts = "*.mcm;*.1sc;" + image_exts
+
+            # wildcard_all is technically redundant, but is useful for Windows
+            #   which has a pulldown menu filtering for each category of files.
+            #   Thus the first "category" will show all applicable files.
+            wildcard_all = "All openable files (" + image_exts + ")|" + \
+                    image_exts + "|"
+            wildcard_mcm = "Marcam Image Data files (*.mcm)|*.mcm|"
+            wildcard_img = "Image Files " + image_wildcards + "|"
+            wildcard_1sc = "Bio-Rad 1sc Files|*.1sc"
+            wildcard = wildcard_all + wildcard_mcm + wildcard_img + wildcard_1sc
+            # Create dialog once and reuse it, subsequent opens are much
+            #   faster (esp. GTK).
+            # native Mac open dialog has no title message
+            self.open_dialog = wx.FileDialog(self,
+                    "" if const.PLATFORM == 'mac' else "Open Image file",
+                    wildcard=wildcard,
+                    style=wx.FD_OPEN | wx.FD_FILE_MUST_EXIST)
+
+        if self.open_dialog.ShowModal() == wx.ID_CANCEL:
             # the user canceled
             return
 
         # get filepath and attempt to open image into bitmap
-        img_path = open_file_dialog.GetPath()
+        img_path = self.open_dialog.GetPath()
         self.open_image(img_path)
 
     @debug_fxn
@@ -852,18 +1047,14 @@ class ImageFrame(wx.Frame):
             evt (wx.CommandEvent): wx Event for this handler
         """
         # get path from file_history
-        img_path = pathlib.Path(
-                self.file_history.GetHistoryFile(evt.GetId() - wx.ID_FILE1)
-                )
-        if img_path.exists():
+        #   (plain str, os.path is cheaper than pathlib for an existence check,
+        #   and results are cached for a short time)
+        img_path = self.file_history.GetHistoryFile(evt.GetId() - wx.ID_FILE1)
+        if _path_exists_cached(img_path):
             self.open_image(img_path)
         else:
             self.file_history.RemoveFileFromHistory(evt.GetId() - wx.ID_FILE1)
-            wx.MessageDialog(self,
-                    message="Unable to find file: %s"%img_path,
-                    caption="File Not Found",
-                    style=wx.OK
-                    ).ShowModal()
+            marcam_extra.file_not_found_dialog(self, img_path)
 
     @debug_fxn
     def open_image(self, img_path):
@@ -876,7 +1067,8 @@ class ImageFrame(wx.Frame):
         Args:
             img_path (pathlike): full path to image to open
         """
-        img_path = pathlib.Path(img_path)
+        if not isinstance(img_path, pathlib.PurePath):
+            img_path = pathlib.Path(img_path)
 
         if self.img_panel.has_no_image():
             # will open error dialog if file is unreadable
@@ -894,20 +1086,33 @@ class ImageFrame(wx.Frame):
         Args:
             img_path (pathlike): full path to image.
         """
-        img_path = pathlib.Path(img_path)
+        if not isinstance(img_path, pathlib.PurePath):
+            img_path = pathlib.Path(img_path)
 
-        if img_path.suffix == ".mcm":
+        # Freeze the frame (and its children) while we change the image,
+        #   title, statusbar and menus, so wx coalesces them all into one
+        #   layout/paint pass when we Thaw.
+        self.Freeze()
+        try:
             # load_mcmfile_from_path also calls self.frame_history.save_notify()
-            img_ok = self.load_mcmfile_from_path(img_path)
-        else:
-            # image or *.1sc file
-            img_ok = self.load_image_from_file(img_path)
-            # By not calling self.frame_history.save_notify(), indicate needs save
+            # For image or *.1sc file (load_image_from_file), by not calling
+            #   self.frame_history.save_notify(), indicate needs save
+            file_loader = self.file_loaders.get(
+                    os.path.splitext(str(img_path))[1].lower(),
+                    self.load_image_from_file
+                    )
+            img_ok = file_loader(img_path)
+
+            if img_ok:
+                zoom = self.img_panel.get_zoom_val()
+                self.set_zoom_status(zoom)
+                self.schedule_menu_refresh()
+        finally:
+            self.Thaw()
 
         if img_ok:
-            zoom = self.img_panel.get_zoom_val()
-            self.statusbar.SetStatusText("Zoom: %.1f%%"%(zoom*100), 1)
-            self.menu_items_enable_disable()
+            # paint new image now that we are thawed
+            self.img_panel.Refresh()
             if const.PLATFORM == 'mac':
                 # on Mac we hide the last frame we close.  So when opening
                 #   we need to make sure to show it again
@@ -922,13 +1127,16 @@ class ImageFrame(wx.Frame):
         Args:
             imdata_path (pathlike): path to .mcm file to open
         """
-        imdata_path = pathlib.Path(imdata_path)
+        if not isinstance(imdata_path, pathlib.PurePath):
+            imdata_path = pathlib.Path(imdata_path)
         # init img_ok to False in case we don't load image
         img_ok = False
 
+        # before loading, so any change to file during load is noticed
+        file_sig = mcmfile.file_signature(imdata_path)
         # first load image from zip
         try:
-            (img, marks, _) = mcmfile.load(imdata_path)
+            (img, marks, _, png_data) = mcmfile.load_with_png_data(imdata_path)
             # need: img, img_name, marks
         except mcmfile.McmFileError:
             img = None
@@ -942,7 +1150,8 @@ class ImageFrame(wx.Frame):
         if img_ok:
             self.img_panel.mark_point_list(marks)
             # reset img history in window to only new image, reset idx
-            self.img_panel.new_img(img)
+            #   reuse PNG data from file for cache, so it isn't re-encoded
+            self.img_panel.new_img(img, png_data=png_data)
             # init image in window
             self.img_panel.init_image()
             # set save_filepath to path of mcm file we loaded
@@ -960,6 +1169,10 @@ class ImageFrame(wx.Frame):
             self.file_history.AddFileToHistory(str(imdata_path))
             # we just loaded .mcm file, so have nothing to save
             self.frame_history.save_notify()
+            # file already contains current image
+            self.set_saved_img(
+                    imdata_path, self.img_panel.get_current_img_id(), file_sig
+                    )
 
         # img_ok will only be True if we successfully loaded file
         return img_ok
@@ -973,22 +1186,16 @@ class ImageFrame(wx.Frame):
         Args:
             img_file (pathlike): full path to image file (JPG, TIFF, etc.)
         """
-        img_file = pathlib.Path(img_file)
+        if not isinstance(img_file, pathlib.PurePath):
+            img_file = pathlib.Path(img_file)
         img_ok = False
 
-        # check for 1sc files and get image data to send to Image
-
-        if img_file.suffix == ".1sc":
-            img = image_proc.file1sc_to_image(img_file)
-        else:
-            # disable logging, we don't care if there is e.g. TIFF image
-            #   with unknown fields
-            no_log = wx.LogNull()
-
-            img = wx.Image(str(img_file))
-
-            # re-enable logging
-            del no_log
+        # pick reader by file suffix (e.g. 1sc files), default wx.Image
+        img_reader = IMAGE_FILE_READERS.get(
+                os.path.splitext(str(img_file))[1].lower(),
+                _read_wx_image_file
+                )
+        img = img_reader(img_file)
 
         # check if img loaded ok
         img_ok = img and img.IsOk()
@@ -1023,11 +1230,8 @@ class ImageFrame(wx.Frame):
             self.activate()
             image_to_close = self.img_path.name
 
-            # changes list
-            (changes_list, never_saved) = self.frame_history.get_actions_since_save()
-            if len(changes_list) > 4:
-                extra_str = "[%d more...]"%(len(changes_list) - 3)
-                changes_list = changes_list[:3] + [extra_str,]
+            # changes summary (first few changes, bulleted)
+            (changes_str, never_saved) = self.frame_history.get_changes_summary()
 
             if never_saved:
                 title = "Save \"%s\" before closing?"%image_to_close
@@ -1036,8 +1240,7 @@ class ImageFrame(wx.Frame):
                 title = "Save changes to \"%s\" before closing?"%image_to_close
                 message = ""
 
-            if changes_list:
-                changes_str = "\n".join(["    \u2022 "+x for x in changes_list])
+            if changes_str:
                 message += "Edits %s:\n%s"%(
                         "made" if never_saved else "since last save",
                         changes_str
@@ -1068,14 +1271,16 @@ class ImageFrame(wx.Frame):
             self.frame_history.save_notify()
             # reset filepath for mcm file to nothing on close
             self.save_filepath = None
+            self.set_saved_img(None, None, None)
             # Make scrolled window show no image.  Also resets frame_history
             self.img_panel.set_no_image()
             # Set window title to generic app name
             self.SetTitle('Marcam')
             # Reset zoom portion of statusbar to show nothing
             self.statusbar.SetStatusText("", 1)
+            self.zoom_status_str = ""
 
-        self.menu_items_enable_disable()
+        self.schedule_menu_refresh()
 
         return True
 
@@ -1111,7 +1316,7 @@ class ImageFrame(wx.Frame):
         # use current filename/path to save
         save_timer = debug_timer.ElTimer()
         save_ok = self.save_img_data(self.save_filepath)
-        save_timer.print_ms("on_save_thread: save: ")
+        save_timer.log_ms(LOGGER.debug, "TIM:on_save_thread: save: ")
         return save_ok
 
     @debug_fxn
@@ -1122,17 +1327,15 @@ class ImageFrame(wx.Frame):
             save_ok (bool): whether file was saved successfully in
                 on_save_thread
         """
+        # we may have created a file, invalidate cached path-exists results
+        #   (for all frames)
+        _path_exists_ttl.cache_clear()
         if save_ok:
             # signify we have saved content
             self.frame_history.save_notify()
         else:
             # error in saving dialog
-            # wx.ICON_ERROR has no effect on Mac
-            wx.MessageDialog(None,
-                    message="Unable to save file: %s"%self.save_filepath,
-                    caption="File Write Error",
-                    style=wx.OK | wx.ICON_EXCLAMATION
-                    ).ShowModal()
+            marcam_extra.file_unable_to_save_dialog(None, self.save_filepath)
 
     @debug_fxn
     def on_saveas(self, _evt):
@@ -1148,30 +1351,31 @@ class ImageFrame(wx.Frame):
             default_dir = self.img_path.parent
             default_filename = self.img_path.with_suffix(".mcm").name
 
-        # native Mac open dialog has no title message
-        with wx.FileDialog(
-                self,
-                "" if const.PLATFORM == 'mac' else "Save MCM file",
-                wildcard="MCM files (*.mcm)|*.mcm",
-                style=wx.FD_SAVE | wx.FD_OVERWRITE_PROMPT,
-                defaultDir=str(default_dir),
-                defaultFile=str(default_filename),
-                ) as file_dialog:
-
-            if file_dialog.ShowModal() == wx.ID_CANCEL:
-                return     # the user changed their mind
-
-            # save the current contents in the file
-            pathname = pathlib.Path(file_dialog.GetPath())
-
-            longtask.ThreadedProgressPulse(
-                    thread_fxn=self.on_saveas_thread,
-                    thread_fxn_args=(pathname,),
-                    post_thread_fxn=self.on_saveas_postthread,
-                    progress_title="Saving Image",
-                    progress_msg="Saving %s..."%pathname.name,
-                    parent=self
+        if self.saveas_dialog is None:
+            # native Mac open dialog has no title message
+            self.saveas_dialog = wx.FileDialog(
+                    self,
+                    "" if const.PLATFORM == 'mac' else "Save MCM file",
+                    wildcard="MCM files (*.mcm)|*.mcm",
+                    style=wx.FD_SAVE | wx.FD_OVERWRITE_PROMPT,
                     )
+        self.saveas_dialog.SetDirectory(str(default_dir))
+        self.saveas_dialog.SetFilename(str(default_filename))
+
+        if self.saveas_dialog.ShowModal() == wx.ID_CANCEL:
+            return     # the user changed their mind
+
+        # save the current contents in the file
+        pathname = pathlib.Path(self.saveas_dialog.GetPath())
+
+        longtask.ThreadedProgressPulse(
+                thread_fxn=self.on_saveas_thread,
+                thread_fxn_args=(pathname,),
+                post_thread_fxn=self.on_saveas_postthread,
+                progress_title="Saving Image",
+                progress_msg="Saving %s..."%pathname.name,
+                parent=self
+                )
 
     @debug_fxn
     def on_saveas_thread(self, pathname):
@@ -1191,6 +1395,9 @@ class ImageFrame(wx.Frame):
             save_ok (bool): whether file was saved successfully
             pathname (pathlib.Path): full path image file was saved to
         """
+        # we may have created a file, invalidate cached path-exists results
+        #   (for all frames)
+        _path_exists_ttl.cache_clear()
         if save_ok:
             self.save_filepath = pathname
             # set img_path
@@ -1208,12 +1415,7 @@ class ImageFrame(wx.Frame):
             self.parent.file_windows.update_window_menu()
         else:
             # error in saving dialog
-            # wx.ICON_ERROR has no effect on Mac
-            wx.MessageDialog(None,
-                    message="Unable to save file: %s"%pathname,
-                    caption="File Write Error",
-                    style=wx.OK | wx.ICON_EXCLAMATION
-                    ).ShowModal()
+            marcam_extra.file_unable_to_save_dialog(None, pathname)
 
     @debug_fxn
     def on_export_image(self, _evt):
@@ -1233,30 +1435,31 @@ class ImageFrame(wx.Frame):
         default_dir = img_path.parent
         default_filename = img_path.stem + "_export.png"
 
-        # native Mac open dialog has no title message
-        with wx.FileDialog(
-                self,
-                "" if const.PLATFORM == 'mac' else "Export Image and Marks as Image",
-                wildcard=wx.Image.GetImageExtWildcard(),
-                style=wx.FD_SAVE | wx.FD_OVERWRITE_PROMPT,
-                defaultDir=str(default_dir),
-                defaultFile=default_filename,
-                ) as file_dialog:
-
-            if file_dialog.ShowModal() == wx.ID_CANCEL:
-                return     # the user changed their mind
-
-            # save the current contents in the file
-            pathname = pathlib.Path(file_dialog.GetPath())
-
-            longtask.ThreadedProgressPulse(
-                    thread_fxn=self.on_export_image_thread,
-                    thread_fxn_args=(pathname,),
-                    post_thread_fxn=None,
-                    progress_title="Saving Image",
-                    progress_msg="Exporting %s..."%pathname.name,
-                    parent=self
+        if self.export_dialog is None:
+            # native Mac open dialog has no title message
+            self.export_dialog = wx.FileDialog(
+                    self,
+                    "" if const.PLATFORM == 'mac' else "Export Image and Marks as Image",
+                    wildcard=_image_wildcard_exts()[0],
+                    style=wx.FD_SAVE | wx.FD_OVERWRITE_PROMPT,
                     )
+        self.export_dialog.SetDirectory(str(default_dir))
+        self.export_dialog.SetFilename(default_filename)
+
+        if self.export_dialog.ShowModal() == wx.ID_CANCEL:
+            return     # the user changed their mind
+
+        # save the current contents in the file
+        pathname = pathlib.Path(self.export_dialog.GetPath())
+
+        longtask.ThreadedProgressPulse(
+                thread_fxn=self.on_export_image_thread,
+                thread_fxn_args=(pathname,),
+                post_thread_fxn=None,
+                progress_title="Saving Image",
+                progress_msg="Exporting %s..."%pathname.name,
+                parent=self
+                )
 
     @debug_fxn
     def on_export_image_thread(self, pathname):
@@ -1267,7 +1470,7 @@ class ImageFrame(wx.Frame):
             pathname (pathlib.Path or str): path to save image to
         """
         # saves from memorydc
-        export_image = self.img_panel.export_to_image_marks()
+        export_image = self.img_panel.export_to_image()
         export_image.SaveFile(str(pathname))
 
     @debug_fxn
@@ -1283,16 +1486,13 @@ class ImageFrame(wx.Frame):
             _evt (wx.CommandEvent):
         """
         action = self.frame_history.undo()
-        LOGGER.info("MSC:undo: %s", repr(action))
-        if action[0] == 'MARK':
-            self.img_panel.delete_mark(action[1], internal=False)
-        if action[0] == 'DELETE_MARK_LIST':
-            self.img_panel.mark_point_list(action[1])
-        if action[0] == 'MOVE_MARK':
-            self.img_panel.move_mark(action[2], action[1], is_selected=False)
-        if action[0] == 'IMAGE_XFORM':
-            self.img_panel.set_img_idx(action[1])
-            self.img_panel.init_image(do_zoom_fit=False)
+        if LOGGER.isEnabledFor(logging.INFO):
+            LOGGER.info("MSC:undo: %s", _summarize_action(action))
+        if action is None:
+            return
+        handler = self.undo_dispatch.get(action[0])
+        if handler is not None:
+            handler(action)
 
     @debug_fxn
     def on_redo(self, _evt):
@@ -1302,16 +1502,24 @@ class ImageFrame(wx.Frame):
             _evt (wx.CommandEvent):
         """
         action = self.frame_history.redo()
-        LOGGER.info("MSC:redo: %s", repr(action))
-        if action[0] == 'MARK':
-            self.img_panel.mark_point(action[1])
-        if action[0] == 'DELETE_MARK_LIST':
-            self.img_panel.delete_mark_point_list(action[1])
-        if action[0] == 'MOVE_MARK':
-            self.img_panel.move_mark(action[1], action[2], is_selected=False)
-        if action[0] == 'IMAGE_XFORM':
-            self.img_panel.set_img_idx(action[2])
-            self.img_panel.init_image(do_zoom_fit=False)
+        if LOGGER.isEnabledFor(logging.INFO):
+            LOGGER.info("MSC:redo: %s", _summarize_action(action))
+        if action is None:
+            return
+        handler = self.redo_dispatch.get(action[0])
+        if handler is not None:
+            handler(action)
+
+    @debug_fxn
+    def image_xform_to_idx(self, img_idx):
+        """Undo/Redo helper for IMAGE_XFORM actions: show image from
+        edit history at img_idx
+
+        Args:
+            img_idx (int): index of image in image edit history to show
+        """
+        self.img_panel.set_img_idx(img_idx)
+        self.img_panel.init_image(do_zoom_fit=False)
 
     @debug_fxn
     def on_select_all(self, _evt):
@@ -1322,6 +1530,19 @@ class ImageFrame(wx.Frame):
         """
         self.img_panel.select_all_marks()
 
+    @debug_fxn
+    def set_zoom_status(self, zoom):
+        """Show zoom level in statusbar, only updating the statusbar if the
+        displayed text changes.
+
+        Args:
+            zoom (float): zoom ratio (1.0 = 100%)
+        """
+        zoom_status_str = "Zoom: %.1f%%"%(zoom*100)
+        if zoom_status_str != self.zoom_status_str:
+            self.statusbar.SetStatusText(zoom_status_str, 1)
+            self.zoom_status_str = zoom_status_str
+
     @debug_fxn
     def on_zoomout(self, _evt):
         """View->Zoom Out menu/toolbar button handler
@@ -1331,7 +1552,7 @@ class ImageFrame(wx.Frame):
         """
         zoom = self.img_panel.zoom(-1)
         if zoom:
-            self.statusbar.SetStatusText("Zoom: %.1f%%"%(zoom*100), 1)
+            self.set_zoom_status(zoom)
 
     @debug_fxn
     def on_zoomin(self, _evt):
@@ -1342,7 +1563,7 @@ class ImageFrame(wx.Frame):
         """
         zoom = self.img_panel.zoom(1)
         if zoom:
-            self.statusbar.SetStatusText("Zoom: %.1f%%"%(zoom*100), 1)
+            self.set_zoom_status(zoom)
 
     @debug_fxn
     def on_zoomfit(self, _evt):
@@ -1353,7 +1574,7 @@ class ImageFrame(wx.Frame):
         """
         zoom = self.img_panel.zoom_fit()
         if zoom:
-            self.statusbar.SetStatusText("Zoom: %.1f%%"%(zoom*100), 1)
+            self.set_zoom_status(zoom)
 
     @debug_fxn
     def on_imginfo(self, _evt):
@@ -1398,7 +1619,10 @@ class ImageFrame(wx.Frame):
         if dialog_val == wx.ID_OK:
             cmap = dialog.get_colormap()
             self.parent.set_last_falsecolor(cmap=cmap)
-            self.img_panel.image_remap_colormap(cmap=cmap)
+            self.img_panel.image_remap_colormap(
+                    cmap=cmap,
+                    lut=self.parent.get_last_falsecolor_lut()
+                    )
 
     @debug_fxn
     def on_imgfalsecolorlast(self, _evt):
@@ -1408,7 +1632,8 @@ class ImageFrame(wx.Frame):
             _evt (wx.CommandEvent):
         """
         self.img_panel.image_remap_colormap(
-                cmap=self.parent.get_last_falsecolor()
+                cmap=self.parent.get_last_falsecolor(),
+                lut=self.parent.get_last_falsecolor_lut()
                 )
 
     @debug_fxn
@@ -1447,13 +1672,48 @@ class ImageFrame(wx.Frame):
         Args:
             imdata_path (pathlike): full path to filename to save to
         """
-        returnval = mcmfile.save_cached(
-                imdata_path,
-                self.img_panel.get_current_img_cachefile(),
-                self.img_panel.marks
-                )
+        img_id = self.img_panel.get_current_img_id()
+        returnval = False
+        if imdata_path == self.saved_img_path and img_id == self.saved_img_id:
+            # file already contains current image, only update marks
+            #   (falls back to full save below if unable, e.g. file changed
+            #   on disk since we loaded or saved it)
+            returnval = mcmfile.save_marks_only(
+                    imdata_path,
+                    self.img_panel.marks,
+                    file_sig=self.saved_img_sig
+                    )
+        if not returnval:
+            # stream PNG cache file into .mcm file instead of reading it all
+            #   into memory first
+            with self.img_panel.open_current_img_cachefile() as img_cache_fh:
+                returnval = mcmfile.save_cached(
+                        imdata_path,
+                        img_cache_fh,
+                        self.img_panel.marks
+                        )
+        if returnval:
+            # may be called from save thread, so update on GUI thread
+            wx.CallAfter(
+                    self.set_saved_img,
+                    imdata_path, img_id, mcmfile.file_signature(imdata_path)
+                    )
         return returnval
 
+    @debug_fxn
+    def set_saved_img(self, imdata_path, img_id, file_sig):
+        """Record which image is in .mcm file on disk.  Must be called from
+        GUI thread.
+
+        Args:
+            imdata_path (pathlike): path to .mcm file, or None if no file
+            img_id (str): img_panel image id of image in .mcm file
+            file_sig (tuple): mcmfile.file_signature() of .mcm file
+        """
+        self.saved_img_path = imdata_path
+        self.saved_img_id = img_id
+        self.saved_img_sig = file_sig
+
     @debug_fxn
     def on_about(self, _evt):
         """Help->About Menuitem: Open the About window
@@ -1476,8 +1736,12 @@ class ImageFrame(wx.Frame):
         Args:
             _evt (wx.CommandEvent):
         """
-        self.html = marcam_extra.HelpFrame(self, id=wx.ID_ANY)
+        # create help window only once, HelpFrame hides itself on close
+        #   so we can show it again later without reloading the html
+        if not self.html:
+            self.html = marcam_extra.HelpFrame(self, id=wx.ID_ANY)
         self.html.Show(True)
+        self.html.Raise()
 
     @debug_fxn
     def on_debug_benchzoom(self, _evt):
@@ -1565,9 +1829,14 @@ class ImageFrame(wx.Frame):
             benchzoom_data['datetime'] = datetime.now().strftime('%Y%m%d_%H:%M:%S')
             data_filename = const.USER_LOG_DIR / \
                     ("data_benchzoom_" + benchzoom_data['datetime'] + ".json")
-            with open(data_filename, 'w') as data_fh:
-                json.dump(benchzoom_data, data_fh, separators=(',', ':'))
-            LOGGER.debug("Wrote benchzoom data to file: %s", data_filename)
+            # write data file in a separate thread, so we don't block the
+            #   UI thread with file I/O
+            longtask.Threaded(
+                    self.debugzoom_write_thread,
+                    (data_filename, benchzoom_data),
+                    None,
+                    self
+                    )
             LOGGER.debug("Finish Debug Benchmark Zoom")
             # reset paint_times to None so on_paint doesn't record
             self.img_panel.paint_times = None
@@ -1575,3 +1844,16 @@ class ImageFrame(wx.Frame):
             self.SetSize(self.benchzoom_origwinsize)
             # zoom back to normal
             self.on_zoomfit(None)
+
+    @debug_fxn
+    def debugzoom_write_thread(self, data_filename, benchzoom_data):
+        """Thread part of debugzoom_helper, writes benchmark data to file
+
+        Args:
+            data_filename (pathlib.Path): path to json file to write
+            benchzoom_data (dict): benchmark data to write to file
+        """
+        data_bytes = json.dumps(benchzoom_data, separators=(',', ':')).encode('utf-8')
+        with open(data_filename, 'wb') as data_fh:
+            data_fh.write(data_bytes)
+        LOGGER.debug("Wrote benchzoom data to file: %s", data_filename)
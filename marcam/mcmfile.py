@@ -15,12 +15,24 @@
 # limitations under the License.
 
 
+import array
+import contextlib
 import io
+import itertools
 import json
 import logging
+import mmap
+import os
+import shutil
+import sys
+import tempfile
 import zipfile
 
 import wx
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 import common
 import debug_timer
@@ -40,11 +52,50 @@ debug_fxn_debug = common.debug_fxn_factory(LOGGER.debug)
 
 
 # for new files
-MCM_VERSION = '1.0.0'
+#   1.1.0: marks also stored in binary MCM_MARKS_NAME member, which is
+#       read instead of info.json 'marks' when present.  info.json still
+#       contains 'marks' so that marcam versions reading 1.0.0 files can
+#       read these files.
+MCM_VERSION = '1.1.0'
 MCM_IMAGE_NAME = 'image.png'
 MCM_INFO_NAME = 'info.json'
+MCM_MARKS_NAME = 'marks.bin'
+
+# PNG data is already compressed, so store it as-is.  info.json and marks
+#   compress well and quickly.
+MCM_IMAGE_COMPRESS_TYPE = zipfile.ZIP_STORED
+MCM_INFO_COMPRESS_TYPE = zipfile.ZIP_DEFLATED
+MCM_INFO_COMPRESS_LEVEL = 1
+# generous allowance for zip local headers, central directory, and
+#   end record of our three-entry .mcm archive
+ZIP_OVERHEAD_SIZE = 1024
+# chunk size when streaming file data into archive
+COPY_BUFFER_SIZE = 1024 * 1024
 
 MCM_LEGACY_IMAGE_PREFIX = 'image.'
+MCM_LEGACY_MARKS_NAME = 'marks.txt'
+
+# largest file to read via mmap (larger files use normal file reads, to
+#   avoid exhausting address space on 32-bit systems)
+MMAP_MAX_SIZE = 512 * 1024 * 1024
+
+# bytes at start of image file that are enough for wx.Image.CanRead to
+#   identify image type
+IMAGE_HEADER_SIZE = 4096
+# first bytes of every PNG file
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+if orjson is not None:
+    # orjson is much faster than json for long marks lists
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+else:
+    _json_loads = json.loads
+    def _json_dumps(obj):
+        """json.dumps with bytes output, to match orjson.dumps
+        """
+        return json.dumps(obj).encode('utf-8')
+
 
 class McmFileError(Exception):
     """Any mcm-specific file error.
@@ -52,6 +103,115 @@ class McmFileError(Exception):
     pass
 
 
+class _MmapFile:
+    """Minimal read-only file object reading from an mmap, for zipfile.
+    (mmap objects lack seekable() and name, which zipfile uses.)
+
+    Methods are not decorated with debug_fxn, as zipfile calls them often.
+    """
+    def __init__(self, file_map, name):
+        self.file_map = file_map
+        self.name = name
+
+    def read(self, size=-1):
+        return self.file_map.read(size)
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        self.file_map.seek(offset, whence)
+        return self.file_map.tell()
+
+    def tell(self):
+        return self.file_map.tell()
+
+    def seekable(self):
+        return True
+
+
+@contextlib.contextmanager
+def _open_zip_read(zip_path):
+    """Context manager: open zipfile for reading, memory-mapping the file
+    if it isn't too large, so reads skip the file buffer copy.
+
+    Args:
+        zip_path (pathlike): path of zip file to open
+
+    Yields:
+        zipfile.ZipFile: zipfile open for reading
+    """
+    with open(str(zip_path), 'rb') as zip_fh:
+        zip_size = os.fstat(zip_fh.fileno()).st_size
+        if 0 < zip_size <= MMAP_MAX_SIZE:
+            with mmap.mmap(zip_fh.fileno(), 0, access=mmap.ACCESS_READ) as zip_map:
+                with zipfile.ZipFile(
+                        _MmapFile(zip_map, str(zip_path)), 'r'
+                        ) as container_fh:
+                    yield container_fh
+        else:
+            with zipfile.ZipFile(zip_fh, 'r') as container_fh:
+                yield container_fh
+
+
+@debug_fxn
+def _marks_to_bytes(marks):
+    """Pack marks into binary data: little-endian int32 x, y pairs.
+
+    Args:
+        marks (list): list of (x,y) mark coordinates
+
+    Returns:
+        bytes: packed marks data
+    """
+    marks_array = array.array('i', itertools.chain.from_iterable(marks))
+    if sys.byteorder == 'big':
+        marks_array.byteswap()
+    return marks_array.tobytes()
+
+@debug_fxn
+def _marks_from_bytes(marks_data):
+    """Unpack marks from binary data made by _marks_to_bytes()
+
+    Args:
+        marks_data (bytes): packed marks data
+
+    Returns:
+        list: list of (x,y) mark coordinate tuples
+
+    Raises:
+        ValueError: if marks_data is not a whole number of (x,y) pairs
+    """
+    marks_array = array.array('i')
+    # raises ValueError if not a multiple of int size
+    marks_array.frombytes(marks_data)
+    if len(marks_array) % 2:
+        raise ValueError("Marks data has unpaired coordinate")
+    if sys.byteorder == 'big':
+        marks_array.byteswap()
+    return list(zip(marks_array[0::2], marks_array[1::2]))
+
+@debug_fxn
+def _mcm_info_and_marks(marks):
+    """Create info.json and marks member data for saving a .mcm file
+
+    Args:
+        marks (list): list of (x,y) mark coordinates
+
+    Returns:
+        (bytes, bytes): (info json data, packed marks data)
+    """
+    # MCM file info dictionary
+    #   'marks' is for readers of 1.0.0 files, newer readers use the
+    #   MCM_MARKS_NAME member
+    mcm_info = {
+            'mcm_version':MCM_VERSION,
+            'mcm_image_name':MCM_IMAGE_NAME,
+            'mcm_info_name':MCM_INFO_NAME,
+            'mcm_marks_name':MCM_MARKS_NAME,
+            'marks_count':len(marks),
+            'marks':marks,
+            }
+    return (_json_dumps(mcm_info), _marks_to_bytes(marks))
+
+
 @debug_fxn
 def _image_readable_fh(image_fh):
     """Check if wx.Image can read this file without making error dialog
@@ -63,10 +223,8 @@ def _image_readable_fh(image_fh):
     Returns:
         bool: True if image was readable by wx.Image
     """
-    no_log = wx.LogNull()
-    img_ok = wx.Image.CanRead(image_fh)
-    # re-enable logging
-    del no_log
+    with common.suppress_wx_log():
+        img_ok = wx.Image.CanRead(image_fh)
     return img_ok
 
 @debug_fxn
@@ -81,39 +239,70 @@ def _read_image_fh(image_fh):
     """
     # disable logging, we don't care if there is e.g. TIFF image
     #   with unknown fields
-    no_log = wx.LogNull()
-    img = wx.Image(image_fh)
-    # re-enable logging
-    del no_log
+    with common.suppress_wx_log():
+        img = wx.Image(image_fh)
 
     return img
 
 @debug_fxn
-def _is_legacy_mcm_file(mcm_path):
-    """Determine if this is a legacy mcm file (different format).
+def _open_preallocated(file_path, size):
+    """Open file for binary writing, reserving size bytes on disk up front
+    (where the OS supports it) so the file isn't grown piece by piece.
+
+    Caller should truncate() the file after writing, in case less than
+    size bytes were written.
+
+    Args:
+        file_path (pathlike): path of file to create or overwrite
+        size (int): number of bytes to preallocate
+
+    Returns:
+        filehandle: binary write filehandle
+    """
+    file_fd = os.open(
+            str(file_path),
+            os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0),
+            0o666
+            )
+    # only Linux/Unix has posix_fallocate (not Mac or Windows)
+    if hasattr(os, 'posix_fallocate') and size > 0:
+        try:
+            os.posix_fallocate(file_fd, 0, size)
+        except OSError:
+            # e.g. filesystem doesn't support it, just write normally
+            pass
+    try:
+        return os.fdopen(file_fd, 'wb')
+    except OSError:
+        os.close(file_fd)
+        raise
+
+@debug_fxn
+def _zip_has_member(container_fh, member_name):
+    """Check if zipfile contains member, using ZipFile's internal name
+    dict lookup instead of searching a new namelist() list.
 
     Args:
-        mcm_path (pathlike): path of mcm file to check if legacy
+        container_fh (zipfile.ZipFile): open zipfile
+        member_name (str): name of member to look for
 
     Returns:
-        bool: True if file is a legacy mcm file
+        bool: True if member_name is in zipfile
     """
     try:
-        with zipfile.ZipFile(str(mcm_path)) as mcm_container:
-            legacy_mcm = MCM_INFO_NAME not in mcm_container.namelist()
-    except (zipfile.BadZipFile, OSError):
-        #raise McmFileError
+        container_fh.getinfo(member_name)
+    except KeyError:
         return False
-    return legacy_mcm
+    return True
 
 @debug_fxn
-def _legacy_load(imdata_path):
+def _legacy_load_from_zip(container_fh):
     """For old mcm files only (before they contained 'info.json')
 
-    Load legacy app .mcm file
+    Load legacy app .mcm file data from already-open zipfile
 
     Args:
-        imdata_path (pathlike): path to .mcm file to open
+        container_fh (zipfile.ZipFile): open .mcm zipfile to read from
 
     Returns:
         (wx.Image, list, str): (wx Image, list of mark coordinates, image name)
@@ -123,32 +312,38 @@ def _legacy_load(imdata_path):
 
     # first load image from zip
     try:
-        with zipfile.ZipFile(str(imdata_path), 'r') as container_fh:
-            namelist = container_fh.namelist()
-            for name in namelist:
-                if name.startswith(MCM_LEGACY_IMAGE_PREFIX):
-                    img_mem_file = io.BytesIO()
-                    with container_fh.open(name, 'r') as img_fh:
-                        img_mem_file.write(img_fh.read())
-                    img_mem_file.seek(0)
-
-                    if name.endswith(".1sc"):
-                        img = image_proc.fh_1sc_to_image(img_mem_file)
-                    else:
-                        img = _read_image_fh(img_mem_file)
-
-                    # check if img loaded ok
-                    img_ok = img.IsOk()
-                    img_name = name
-
-                if name == "marks.txt":
-                    with container_fh.open(name, 'r') as json_fh:
-                        marks = json.load(json_fh)
-                    marks = [tuple(x) for x in marks]
+        # find each member we need once, instead of testing every name
+        #   for both.  Iterate ZipFile's name dict directly rather than
+        #   building a new list with namelist().
+        img_name = next(
+                (
+                    x for x in container_fh.NameToInfo
+                    if x.startswith(MCM_LEGACY_IMAGE_PREFIX)
+                    ),
+                None
+                )
+        has_marks = _zip_has_member(container_fh, MCM_LEGACY_MARKS_NAME)
+
+        if img_name is not None and has_marks:
+            # read image straight into memory, no temp file needed
+            #   for either wx.Image or .1sc files
+            with container_fh.open(img_name, 'r') as img_fh:
+                img_mem_file = io.BytesIO(img_fh.read())
+
+            if img_name.endswith(".1sc"):
+                img = image_proc.fh_1sc_to_image(img_mem_file)
+            else:
+                img = _read_image_fh(img_mem_file)
+
+            # check if img loaded ok
+            img_ok = img.IsOk()
+
+            with container_fh.open(MCM_LEGACY_MARKS_NAME, 'r') as json_fh:
+                marks = _json_loads(json_fh.read())
     except OSError:
         img_ok = False
         LOGGER.warning(
-                "Cannot open data in file '%s'.", imdata_path,
+                "Cannot open data in file '%s'.", container_fh.filename,
                 exc_info=True
                 )
     # error return
@@ -156,11 +351,29 @@ def _legacy_load(imdata_path):
         return (None, None, None)
 
     # make sure marks coordinates are tuples
-    marks = [tuple(x) for x in marks]
+    marks = list(map(tuple, marks))
 
     return (img, marks, img_name)
 
 
+@debug_fxn
+def file_signature(mcm_path):
+    """Get signature of file on disk, that changes if the file is replaced
+    or rewritten.
+
+    Args:
+        mcm_path (pathlike): path of mcm file
+
+    Returns:
+        tuple: (modification time in ns, size) of file, or None if file
+            can't be accessed
+    """
+    try:
+        mcm_stat = os.stat(str(mcm_path))
+    except OSError:
+        return None
+    return (mcm_stat.st_mtime_ns, mcm_stat.st_size)
+
 @debug_fxn
 def is_valid(mcm_path):
     """Detect if this image is readable by this program.
@@ -173,38 +386,43 @@ def is_valid(mcm_path):
     Returns:
         bool: True if file is a valid mcm file
     """
-    # if legacy file use legacy file function
-    if _is_legacy_mcm_file(mcm_path):
-        # Actually try and load file.  This is slow, but hopefully we
-        #   won't often need to test legacy files.
-        file_ok = (_legacy_load(mcm_path) != (None, None, None))
-        return file_ok
-
-    # Modern MCM (version > 1.0)
-    if zipfile.is_zipfile(str(mcm_path)):
-        # for .mcm files
-        # verify internals of zipfile
-        try:
-            with zipfile.ZipFile(str(mcm_path), 'r') as container_fh:
-                with container_fh.open(MCM_INFO_NAME, 'r') as info_fh:
-                    info = json.load(info_fh)
-
-                marks_ok = info.get('marks', None) is not None
-                image_name = info['mcm_image_name']
+    # open zipfile (and parse its directory) only once, for both legacy
+    #   check and verification
+    try:
+        with _open_zip_read(mcm_path) as container_fh:
+            if not _zip_has_member(container_fh, MCM_INFO_NAME):
+                # Legacy file: actually try and load file.  This is slow,
+                #   but hopefully we won't often need to test legacy files.
+                return _legacy_load_from_zip(container_fh) != (None, None, None)
+
+            # Modern MCM (version > 1.0)
+            # verify internals of zipfile
+            with container_fh.open(MCM_INFO_NAME, 'r') as info_fh:
+                info = _json_loads(info_fh.read())
 
-                png_mem_file = io.BytesIO()
-                with container_fh.open(image_name, 'r') as img_fh:
-                    png_mem_file.write(img_fh.read())
-                png_mem_file.seek(0)
+            # marks in binary member (version >= 1.1) or in info.json
+            marks_ok = (
+                    info.get('marks', None) is not None
+                    or _zip_has_member(container_fh, info.get('mcm_marks_name', ''))
+                    )
+            image_name = info['mcm_image_name']
 
-                # check if img is readable
-                img_ok = _image_readable_fh(png_mem_file)
+            # wx.Image.CanRead only checks the file header, so don't read
+            #   (and allocate memory for) the whole image
+            with container_fh.open(image_name, 'r') as img_fh:
+                img_header = img_fh.read(IMAGE_HEADER_SIZE)
+
+            # check if img is readable
+            #   fast path: we always save PNG images, so just check its
+            #   signature.  Otherwise ask wx.
+            img_ok = (
+                    img_header.startswith(PNG_SIGNATURE)
+                    or _image_readable_fh(io.BytesIO(img_header))
+                    )
 
-                mcm_ok = img_ok and marks_ok
+            mcm_ok = img_ok and marks_ok
 
-        except zipfile.BadZipFile:
-            mcm_ok = False
-    else:
+    except (zipfile.BadZipFile, OSError, KeyError):
         mcm_ok = False
 
     return mcm_ok
@@ -219,6 +437,23 @@ def load(imdata_path):
     Returns:
         (wx.Image, list, str): (wx Image, list of mark coordinates, image name)
     """
+    return load_with_png_data(imdata_path)[:3]
+
+@debug_fxn
+def load_with_png_data(imdata_path):
+    """Load native app .mcm file, also returning the PNG file data of the
+    image as stored in the file.
+
+    The PNG data can be used (e.g. as the image cache file) instead of
+    encoding the wx.Image to PNG again.
+
+    Args:
+        imdata_path (pathlike): path to .mcm file to open
+
+    Returns:
+        (wx.Image, list, str, bytes): (wx Image, list of mark coordinates,
+            image name, PNG data or None if image is not stored as PNG)
+    """
     # Using BytesIO is almost 20% faster on a large image than using tempfile
     #   in one test (iMac, Fusion Drive)  (Average 375ms vs. 461ms)
 
@@ -226,30 +461,41 @@ def load(imdata_path):
     # init img_ok to False in case we don't load image
     img_ok = False
 
-    # if legacy file use legacy file function
-    if _is_legacy_mcm_file(imdata_path):
-        return _legacy_load(imdata_path)
-
-    # Modern MCM (version > 1.0)
     # first load image from zip
     try:
-        with zipfile.ZipFile(str(imdata_path), 'r') as container_fh:
-            with container_fh.open(MCM_INFO_NAME, 'r') as info_fh:
-                info = json.load(info_fh)
+        with _open_zip_read(imdata_path) as container_fh:
+            # if legacy file use legacy file function, with the zipfile
+            #   we already have open
+            if not _zip_has_member(container_fh, MCM_INFO_NAME):
+                return _legacy_load_from_zip(container_fh) + (None,)
 
-            marks = info['marks']
+            # Modern MCM (version > 1.0)
+            with container_fh.open(MCM_INFO_NAME, 'r') as info_fh:
+                info = _json_loads(info_fh.read())
+
+            if 'mcm_marks_name' in info:
+                # version >= 1.1: binary marks member
+                marks = _marks_from_bytes(
+                        container_fh.read(info['mcm_marks_name'])
+                        )
+            else:
+                # make sure marks coordinates are tuples
+                marks = list(map(tuple, info['marks']))
             image_name = info['mcm_image_name']
 
-            png_mem_file = io.BytesIO()
+            # BytesIO initialized from bytes shares their buffer, no copy
             with container_fh.open(image_name, 'r') as img_fh:
-                png_mem_file.write(img_fh.read())
-            png_mem_file.seek(0)
+                png_data = img_fh.read()
+            png_mem_file = io.BytesIO(png_data)
             img = _read_image_fh(png_mem_file)
+            if not png_data.startswith(PNG_SIGNATURE):
+                png_data = None
 
             # check if img loaded ok
             img_ok = img.IsOk()
 
-    except (zipfile.BadZipFile, OSError) as err:
+    except (zipfile.BadZipFile, OSError, ValueError) as err:
+        # ValueError: corrupt marks data
         LOGGER.warning(
                 "Cannot open data in file '%s': %s", imdata_path, err,
                 exc_info=True
@@ -262,12 +508,9 @@ def load(imdata_path):
 
     # error return
     if not img_ok:
-        return (None, None, None)
-
-    # make sure marks coordinates are tuples
-    marks = [tuple(x) for x in marks]
+        return (None, None, None, None)
 
-    return (img, marks, image_name)
+    return (img, marks, image_name, png_data)
 
 @debug_fxn
 def save(imdata_path, img, marks):
@@ -282,24 +525,45 @@ def save(imdata_path, img, marks):
     # In-memory filehandle to save PNG data to from Image
     png_mem_file = io.BytesIO()
     img.SaveFile(png_mem_file, wx.BITMAP_TYPE_PNG)
-    png_mem_file.seek(0)
 
-    mcm_info = {
-            'mcm_version':MCM_VERSION,
-            'mcm_image_name':MCM_IMAGE_NAME,
-            'mcm_info_name':MCM_INFO_NAME,
-            'marks':marks
-            }
+    (mcm_info_json, marks_data) = _mcm_info_and_marks(marks)
+    # upper bound of file size: uncompressed data plus zip headers
+    mcm_size = (
+            png_mem_file.getbuffer().nbytes + len(mcm_info_json)
+            + len(marks_data) + ZIP_OVERHEAD_SIZE
+            )
     # write new save file
     try:
-        with zipfile.ZipFile(str(imdata_path), 'w') as container_fh:
-            # write image file data to archive
-            container_fh.writestr(MCM_IMAGE_NAME, png_mem_file.read())
-            # write json text file to archive
-            container_fh.writestr(
-                    MCM_INFO_NAME,
-                    json.dumps(mcm_info)
-                    )
+        with _open_preallocated(imdata_path, mcm_size) as mcm_fh:
+            with zipfile.ZipFile(
+                    mcm_fh, 'w', compression=MCM_IMAGE_COMPRESS_TYPE
+                    ) as container_fh:
+                # write image file data to archive
+                #   getbuffer() is a memoryview of the PNG data, avoiding the
+                #   copy that read() would make.  Release it when done so
+                #   png_mem_file isn't left pinned.
+                with png_mem_file.getbuffer() as png_data:
+                    container_fh.writestr(
+                            MCM_IMAGE_NAME,
+                            png_data,
+                            compress_type=MCM_IMAGE_COMPRESS_TYPE
+                            )
+                # write json text file to archive
+                container_fh.writestr(
+                        MCM_INFO_NAME,
+                        mcm_info_json,
+                        compress_type=MCM_INFO_COMPRESS_TYPE,
+                        compresslevel=MCM_INFO_COMPRESS_LEVEL
+                        )
+                # write binary marks file to archive
+                container_fh.writestr(
+                        MCM_MARKS_NAME,
+                        marks_data,
+                        compress_type=MCM_INFO_COMPRESS_TYPE,
+                        compresslevel=MCM_INFO_COMPRESS_LEVEL
+                        )
+            # remove any preallocated space past the end of zip data
+            mcm_fh.truncate()
     except OSError:
         LOGGER.warning("Cannot save current data in file '%s'.", imdata_path)
         returnval = False
@@ -309,35 +573,55 @@ def save(imdata_path, img, marks):
     return returnval
 
 @debug_fxn
-def save_cached(imdata_path, img_cache_bytes, marks):
+def save_cached(imdata_path, img_cache_fh, marks):
     """Save image and mark locations to .mcm zipfile
 
     Args:
         imdata_path (pathlike): full path to filename to save to
+        img_cache_fh (filehandle): binary read filehandle of PNG image data
+        marks (list): list of (x,y) mark coordinates
 
     Returns:
         bool: whether save was successful, True or False
     """
-    # MCM file info dictionary
-    mcm_info = {
-            'mcm_version':MCM_VERSION,
-            'mcm_image_name':MCM_IMAGE_NAME,
-            'mcm_info_name':MCM_INFO_NAME,
-            'marks':marks
-            }
+    (mcm_info_json, marks_data) = _mcm_info_and_marks(marks)
 
     # write new save file
     try:
-        with zipfile.ZipFile(str(imdata_path), 'w') as container_fh:
-            imgsave_timer = debug_timer.ElTimer()
-            # write image file data to archive
-            container_fh.writestr(MCM_IMAGE_NAME, img_cache_bytes)
-            imgsave_timer.print_ms("save_cached: image writestr: ")
-            # write json text file to archive
-            container_fh.writestr(
-                    MCM_INFO_NAME,
-                    json.dumps(mcm_info)
-                    )
+        # upper bound of file size: uncompressed data plus zip headers
+        mcm_size = (
+                os.fstat(img_cache_fh.fileno()).st_size + len(mcm_info_json)
+                + len(marks_data) + ZIP_OVERHEAD_SIZE
+                )
+        with _open_preallocated(imdata_path, mcm_size) as mcm_fh:
+            # ZipFile.open() uses the archive's default compression
+            with zipfile.ZipFile(
+                    mcm_fh, 'w', compression=MCM_IMAGE_COMPRESS_TYPE
+                    ) as container_fh:
+                imgsave_timer = debug_timer.ElTimer()
+                # stream image file data to archive, without holding the
+                #   whole file in memory
+                with container_fh.open(MCM_IMAGE_NAME, 'w') as img_fh:
+                    shutil.copyfileobj(img_cache_fh, img_fh, COPY_BUFFER_SIZE)
+                imgsave_timer.log_ms(
+                        LOGGER.debug, "TIM:save_cached: image write: "
+                        )
+                # write json text file to archive
+                container_fh.writestr(
+                        MCM_INFO_NAME,
+                        mcm_info_json,
+                        compress_type=MCM_INFO_COMPRESS_TYPE,
+                        compresslevel=MCM_INFO_COMPRESS_LEVEL
+                        )
+                # write binary marks file to archive
+                container_fh.writestr(
+                        MCM_MARKS_NAME,
+                        marks_data,
+                        compress_type=MCM_INFO_COMPRESS_TYPE,
+                        compresslevel=MCM_INFO_COMPRESS_LEVEL
+                        )
+            # remove any preallocated space past the end of zip data
+            mcm_fh.truncate()
     except OSError:
         LOGGER.warning("Cannot save current data in file '%s'.", imdata_path)
         returnval = False
@@ -345,3 +629,95 @@ def save_cached(imdata_path, img_cache_bytes, marks):
         returnval = True
 
     return returnval
+
+@debug_fxn
+def save_marks_only(imdata_path, marks, file_sig=None):
+    """Update mark locations in existing .mcm file, keeping its image.
+
+    Image data is copied as-is from the existing file, so no image
+    encoding is needed.  The new file is written next to the existing
+    one and then replaces it, so the existing file is intact if
+    anything fails.
+
+    Args:
+        imdata_path (pathlike): full path of existing .mcm file to update
+        marks (list): list of (x,y) mark coordinates
+        file_sig (tuple): if not None, file_signature() the existing file
+            must still have, i.e. when its image was loaded or saved.  If
+            the file has changed since then, it is not updated.
+
+    Returns:
+        bool: whether save was successful, True or False.  False if file
+            could not be updated (e.g. legacy .mcm file, or file changed
+            since file_sig), so caller should save whole file instead.
+    """
+    (mcm_info_json, marks_data) = _mcm_info_and_marks(marks)
+
+    # path of new file, None until it is created
+    tmp_path = None
+    try:
+        # don't copy image from a file someone else has replaced
+        if file_sig is not None and file_signature(imdata_path) != file_sig:
+            raise McmFileError("File changed since last load or save")
+        # fails if dir is not writable (even if existing file is)
+        (tmp_fd, tmp_path) = tempfile.mkstemp(
+                suffix='.mcm.tmp',
+                prefix='.',
+                dir=os.path.dirname(os.path.abspath(str(imdata_path)))
+                )
+        os.close(tmp_fd)
+        with _open_zip_read(imdata_path) as container_in_fh:
+            # legacy files need their image converted, so can't be updated
+            if not _zip_has_member(container_in_fh, MCM_INFO_NAME):
+                raise McmFileError("Legacy .mcm file")
+            with container_in_fh.open(MCM_INFO_NAME, 'r') as info_fh:
+                image_name = _json_loads(info_fh.read())['mcm_image_name']
+
+            # upper bound of file size: uncompressed data plus zip headers
+            mcm_size = (
+                    container_in_fh.getinfo(image_name).file_size
+                    + len(mcm_info_json) + len(marks_data) + ZIP_OVERHEAD_SIZE
+                    )
+            with _open_preallocated(tmp_path, mcm_size) as mcm_fh:
+                with zipfile.ZipFile(
+                        mcm_fh, 'w', compression=MCM_IMAGE_COMPRESS_TYPE
+                        ) as container_fh:
+                    # copy image file data from existing archive
+                    with container_in_fh.open(image_name, 'r') as img_in_fh:
+                        with container_fh.open(MCM_IMAGE_NAME, 'w') as img_fh:
+                            shutil.copyfileobj(
+                                    img_in_fh, img_fh, COPY_BUFFER_SIZE
+                                    )
+                    # write json text file to archive
+                    container_fh.writestr(
+                            MCM_INFO_NAME,
+                            mcm_info_json,
+                            compress_type=MCM_INFO_COMPRESS_TYPE,
+                            compresslevel=MCM_INFO_COMPRESS_LEVEL
+                            )
+                    # write binary marks file to archive
+                    container_fh.writestr(
+                            MCM_MARKS_NAME,
+                            marks_data,
+                            compress_type=MCM_INFO_COMPRESS_TYPE,
+                            compresslevel=MCM_INFO_COMPRESS_LEVEL
+                            )
+                # remove any preallocated space past the end of zip data
+                mcm_fh.truncate()
+        # keep permissions of existing file, not mkstemp's private ones
+        shutil.copymode(str(imdata_path), tmp_path)
+        os.replace(tmp_path, str(imdata_path))
+    except (McmFileError, zipfile.BadZipFile, OSError, KeyError) as err:
+        LOGGER.warning(
+                "Cannot update marks in file '%s': %s", imdata_path, err
+                )
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+        returnval = False
+    else:
+        returnval = True
+
+    return returnval
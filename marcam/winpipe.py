@@ -19,11 +19,13 @@
 # https://stackoverflow.com/questions/48542644/python-and-windows-named-pipes
 
 
+import codecs
 import logging
 import time
 import sys
 
 import pywintypes
+import win32event
 import win32pipe
 import win32file
 
@@ -52,6 +54,72 @@ debug_fxn_debug = common.debug_fxn_factory(LOGGER.debug)
 # constant not defined by win32pipe
 PIPE_REJECT_REMOTE_CLIENTS = 8
 
+# dwOpenMode for server pipe
+#   can be one of:
+#     PIPE_ACCESS_DUPLEX, PIPE_ACCESS_INBOUND, PIPE_ACCESS_OUTBOUND
+#   additionally can have:
+#     FILE_FLAG_OVERLAPPED, so connect and read can wait on a quit event as
+#     well as the pipe
+SERVER_PIPE_OPEN_MODE = (
+        win32pipe.PIPE_ACCESS_INBOUND | win32file.FILE_FLAG_OVERLAPPED
+        )
+# dwPipeMode for server pipe
+#   can be one of:
+#     PIPE_TYPE_MESSAGE, PIPE_TYPE_BYTE,
+#   additionally can have one of:
+#     PIPE_READMODE_MESSAGE, PIPE_READMODE_BYTE
+#   additionally can have one of:
+#     PIPE_WAIT, PIPE_NOWAIT
+#   Message read mode: each client WriteFile is read back as exactly one
+#     message, so fast consecutive writes are never merged.
+SERVER_PIPE_MODE = (
+        win32pipe.PIPE_TYPE_MESSAGE | win32pipe.PIPE_READMODE_MESSAGE
+        | win32pipe.PIPE_WAIT | PIPE_REJECT_REMOTE_CLIENTS
+        )
+
+# separates strings batched into one pipe message.  (NUL can't occur in
+#   file paths.)
+MSG_SEPARATOR = '\0'
+
+# Windows error codes
+ERROR_FILE_NOT_FOUND = 2
+ERROR_BROKEN_PIPE = 109
+ERROR_PIPE_BUSY = 231
+ERROR_NO_DATA = 232
+ERROR_MORE_DATA = 234
+ERROR_PIPE_CONNECTED = 535
+ERROR_OPERATION_ABORTED = 995
+ERROR_IO_PENDING = 997
+
+# number of times to try connecting while pipe is being closed (server) or
+#   busy (client), and initial delay in seconds between server tries
+#   (doubles every retry)
+CONNECT_RETRIES = 8
+CONNECT_RETRY_DELAY = 10e-3
+
+# how long client waits in ms for a busy pipe to become available
+PIPE_BUSY_TIMEOUT_MS = 2000
+
+# utf-8 codec functions, bound once instead of looked up by name for every
+#   encode/decode
+_UTF8_ENCODE = codecs.utf_8_encode
+_UTF8_DECODE = codecs.utf_8_decode
+
+# size of pipe inbound buffer and of the server read buffer (allocated once
+#   per server and reused), large enough for any one message
+PIPE_BUFFER_SIZE = 1024*1024
+
+
+def log_win_error(err):
+    """Log details of a Windows error as an error
+
+    Args:
+        err (pywintypes.error): Windows error exception
+    """
+    LOGGER.error("Windows error:\n    %s\n   %s\n    %s",
+            err.winerror, err.funcname, err.strerror
+            )
+
 
 # ------------------------------------------------------------------------
 # SERVER STUFF
@@ -86,28 +154,21 @@ def server_create_named_pipe_raw(pipe_name):
             pipe_name,
             # dwOpenMode
             # ----------
-            # can be one of:
-            #   PIPE_ACCESS_DUPLEX, PIPE_ACCESS_INBOUND, PIPE_ACCESS_OUTBOUND
-            win32pipe.PIPE_ACCESS_INBOUND,
+            SERVER_PIPE_OPEN_MODE,
             # dwPipeMode
             # ----------
-            # can be one of:
-            #   PIPE_TYPE_MESSAGE, PIPE_TYPE_BYTE,
-            # additionally can have one of:
-            #   PIPE_READMODE_MESSAGE, PIPE_READMODE_BYTE
-            # additionally can have one of:
-            #   PIPE_WAIT, PIPE_NOWAIT
-            win32pipe.PIPE_TYPE_MESSAGE | win32pipe.PIPE_READMODE_BYTE \
-                    | win32pipe.PIPE_WAIT | PIPE_REJECT_REMOTE_CLIENTS,
+            SERVER_PIPE_MODE,
             # nMaxInstances
             # -------------
             1,
             # nOutBufferSize
             # -------------
-            65536,
+            # Sizes are advisory, but reserve system memory.  Server pipe is
+            #   PIPE_ACCESS_INBOUND, so it never needs an outbound buffer.
+            0,
             # nInBufferSize
             # -------------
-            65536,
+            PIPE_BUFFER_SIZE,
             # nDefaultTimeOut
             # ---------------
             # in milliseconds. 0 means "50 ms"
@@ -129,139 +190,262 @@ def server_create_named_pipe(pipe_name):
     Returns:
         PyHANDLE: handle to named pipe
     """
-    no_pipe_instance = True
-    while no_pipe_instance:
-        try:
-            pipe_handle = server_create_named_pipe_raw(pipe_name)
-        except pywintypes.error as err:
-            (winerror, funcname, strerror) = err.args
-            LOGGER.error("Windows error:\n    %s\n   %s\n    %s",
-                    winerror, funcname, strerror
-                    )
-            raise
-        else:
-            # created named pipe OK
-            no_pipe_instance = False
+    try:
+        pipe_handle = server_create_named_pipe_raw(pipe_name)
+    except pywintypes.error as err:
+        log_win_error(err)
+        raise
 
     return pipe_handle
 
 @debug_fxn
-def server_connect_and_wait_raw(pipe_handle):
-    """Wait for a client connection, do not return until one is found.
+def new_quit_event():
+    """Create an event that can be used to make server_pipe_read return.
+
+    Returns:
+        (PyHANDLE): handle to manual-reset event, initially not set
+    """
+    return win32event.CreateEvent(None, True, False, None)
+
+@debug_fxn
+def set_quit_event(quit_event):
+    """Signal server waiting on quit_event to stop.
+
+    Args:
+        quit_event (PyHANDLE): event from new_quit_event()
+    """
+    win32event.SetEvent(quit_event)
+
+@debug_fxn
+def new_overlapped():
+    """Create OVERLAPPED structure with its own event, for async I/O on
+    server pipe.
+
+    Returns:
+        (PyOVERLAPPED): overlapped structure
+    """
+    overlapped = pywintypes.OVERLAPPED()
+    overlapped.hEvent = win32event.CreateEvent(None, True, False, None)
+    return overlapped
 
-    Assumes server_create_named_pipe used PIPE_WAIT mode.
+def wait_overlapped(pipe_handle, overlapped, quit_event=None):
+    """Wait for an overlapped operation on pipe to finish, or for
+    quit_event to be set.
+
+    If quit_event is set first, the pending operation is cancelled.
+
+    Args:
+        pipe_handle (PyHANDLE): pipe handle with pending operation
+        overlapped (PyOVERLAPPED): overlapped structure used for operation
+        quit_event (PyHANDLE): event to also wait on, or None
+
+    Returns:
+        (int): number of bytes transferred, or None if quit_event was set
+    """
+    wait_handles = [overlapped.hEvent]
+    if quit_event is not None:
+        wait_handles.append(quit_event)
+    wait_result = win32event.WaitForMultipleObjects(
+            wait_handles, False, win32event.INFINITE
+            )
+    if wait_result != win32event.WAIT_OBJECT_0:
+        # quit_event: cancel pending operation and wait for it to actually
+        #   stop before its buffer can go away
+        win32file.CancelIo(pipe_handle)
+        try:
+            win32file.GetOverlappedResult(pipe_handle, overlapped, True)
+        except pywintypes.error as err:
+            if err.winerror != ERROR_OPERATION_ABORTED:
+                raise
+        return None
+
+    return win32file.GetOverlappedResult(pipe_handle, overlapped, False)
+
+def server_connect_and_wait_raw(pipe_handle, overlapped, quit_event=None):
+    """Wait for a client connection, do not return until one is found or
+    quit_event is set.
 
     Args:
         pipe_handle (PyHANDLE): pipe handle to connect to
+        overlapped (PyOVERLAPPED): overlapped structure from new_overlapped()
+        quit_event (PyHANDLE): event to stop waiting, or None
+
+    Returns:
+        (bool): True if client connected, False if quit_event was set
     """
     try:
-        win32pipe.ConnectNamedPipe(pipe_handle, None)
+        result = win32pipe.ConnectNamedPipe(pipe_handle, overlapped)
     except pywintypes.error as err:
-        (winerror, funcname, strerror) = err.args
-        LOGGER.error("Windows error:\n    %s\n   %s\n    %s",
-                winerror, funcname, strerror
-                )
+        log_win_error(err)
         raise
 
-def server_connect_and_wait(pipe_handle):
-    """Wait for a client connection, do not return until one is found.
+    if result == ERROR_PIPE_CONNECTED:
+        # client connected between CreateNamedPipe and ConnectNamedPipe
+        return True
+
+    return wait_overlapped(pipe_handle, overlapped, quit_event) is not None
+
+def server_connect_and_wait(pipe_handle, overlapped, quit_event=None):
+    """Wait for a client connection, do not return until one is found or
+    quit_event is set.
 
     Server function.
 
     Args:
         pipe_handle (PyHANDLE): pipe handle to connect to
+        overlapped (PyOVERLAPPED): overlapped structure from new_overlapped()
+        quit_event (PyHANDLE): event to stop waiting, or None
+
+    Returns:
+        (bool): True if client connected, False if quit_event was set
+
+    Raises:
+        pywintypes.error: on any error, or if pipe is still being closed
+            after CONNECT_RETRIES tries
     """
-    no_connection = True
-    while no_connection:
+    for retry in range(CONNECT_RETRIES):
         try:
-            server_connect_and_wait_raw(pipe_handle)
+            return server_connect_and_wait_raw(
+                    pipe_handle, overlapped, quit_event
+                    )
         except pywintypes.error as err:
-            (winerror, funcname, strerror) = err.args
-            if winerror == 232:
-                # The pipe is being closed, try again
+            if err.winerror == ERROR_NO_DATA and retry < CONNECT_RETRIES - 1:
+                # The previous client closed its end of the pipe.  Our end
+                #   must be disconnected before it can be connected to a new
+                #   client, then try again after backoff
                 LOGGER.info("The pipe is being closed, trying again.")
+                win32pipe.DisconnectNamedPipe(pipe_handle)
+                time.sleep(CONNECT_RETRY_DELAY * 2**retry)
             else:
-                LOGGER.error("Windows error:\n    %s\n   %s\n    %s",
-                        winerror, funcname, strerror
-                        )
+                log_win_error(err)
                 raise
-        else:
-            # connected pipe and waited OK
-            no_connection = False
 
-@debug_fxn
-def pipe_read(pipe_handle):
-    """Read bytes from pipe and decode (using utf-8) into string
+def pipe_read(pipe_handle, read_buf, overlapped, quit_event=None):
+    """Read one whole message from pipe and decode (using utf-8) into string
+
+    Messages longer than read_buf are read in parts and joined before
+    decoding, so they are never returned partially.
 
     Args:
         pipe_handle (PyHANDLE): pipe handle to read from
+        read_buf (PyOVERLAPPEDReadBuffer): buffer to read into, reused
+            between reads (see win32file.AllocateReadBuffer)
+        overlapped (PyOVERLAPPED): overlapped structure from new_overlapped()
+        quit_event (PyHANDLE): event to stop waiting, or None
 
     Returns:
-        (str): string read from pipe
+        (str): string read from pipe, or None if quit_event was set
     """
-    (_, resp_bytes) = win32file.ReadFile(pipe_handle, 64*1024)
-    resp_str = resp_bytes.decode(encoding='utf-8')
+    # parts of message so far, only used if message is longer than read_buf
+    msg_parts = None
+    while True:
+        # returns immediately, with read either done or pending.  In both
+        #   cases overlapped.hEvent is set when data is ready.
+        win32file.ReadFile(pipe_handle, read_buf, overlapped)
+        try:
+            num_bytes = wait_overlapped(pipe_handle, overlapped, quit_event)
+        except pywintypes.error as err:
+            if err.winerror != ERROR_MORE_DATA:
+                raise
+            # read_buf is full and rest of message is still in pipe
+            if msg_parts is None:
+                msg_parts = bytearray()
+            msg_parts += read_buf
+        else:
+            break
+
+    if num_bytes is None:
+        return None
+
+    if msg_parts is None:
+        # usual case: decode straight from read buffer, without copying to
+        #   bytes first
+        msg_data = read_buf[:num_bytes]
+    else:
+        msg_parts += read_buf[:num_bytes]
+        msg_data = msg_parts
+    # decode once for whole message, so multi-byte characters split
+    #   between reads are handled
+    (resp_str, _) = _UTF8_DECODE(msg_data, 'strict', True)
     return resp_str
 
 @debug_fxn
-def server_pipe_read(pipe_name, string_read_fxn):
+def server_pipe_read(pipe_name, string_read_fxn, quit_event=None):
     """Create a pipe server that reads only.
 
-    When a message is read, execute string_read_fxn on the received string.
+    When a message is read, execute string_read_fxn on each string it
+    contains (strings in a message are separated by MSG_SEPARATOR).
+    Runs until quit_event is set.
 
     Args:
         pipe_name (str): name of named pipe
         string_read_fxn (fxn_handle): handle to function that accepts str
+        quit_event (PyHANDLE): event from new_quit_event() to stop server,
+            or None to run forever
     """
     filearg_pipe = server_create_named_pipe(pipe_name)
-    while True:
+    overlapped = new_overlapped()
+    read_buf = win32file.AllocateReadBuffer(PIPE_BUFFER_SIZE)
+    server_quit = False
+    while not server_quit:
         client_done = False
         LOGGER.info("Waiting for client...")
-        server_connect_and_wait(filearg_pipe)
+        if not server_connect_and_wait(filearg_pipe, overlapped, quit_event):
+            break
         LOGGER.info("Got client.")
         while not client_done:
             # keep reading from this client until it closes access to pipe
             try:
-                resp_str = pipe_read(filearg_pipe)
+                resp_str = pipe_read(
+                        filearg_pipe, read_buf, overlapped, quit_event
+                        )
             except pywintypes.error as err:
-                (winerror, funcname, strerror) = err.args
-                if winerror == 109:
-                    LOGGER.info("Client closed access to pipe.")
-                    client_done = True
-                else:
-                    LOGGER.error("Windows error:\n    %s\n   %s\n    %s",
-                            winerror, funcname, strerror
-                            )
-                    client_done = True
+                if err.winerror != ERROR_BROKEN_PIPE:
+                    log_win_error(err)
                     raise
+                LOGGER.info("Client closed access to pipe.")
+                client_done = True
             else:
-                string_read_fxn(resp_str)
-            finally:
-                if client_done:
-                    # Disconnect client from pipe
-                    win32pipe.DisconnectNamedPipe(filearg_pipe)
+                if resp_str is None:
+                    server_quit = True
+                    client_done = True
+                else:
+                    # one message may hold several strings
+                    for data_string in resp_str.split(MSG_SEPARATOR):
+                        string_read_fxn(data_string)
+
+        # Disconnect client from pipe
+        win32pipe.DisconnectNamedPipe(filearg_pipe)
+
+    LOGGER.info("Quitting pipe server.")
+    win32file.CloseHandle(filearg_pipe)
 
 
 # ------------------------------------------------------------------------
 # CLIENT STUFF
 # ------------
 
-# For client stuff we really don't have any logging facilities currently.
-#   (We are operating without a log file because we are not the primary
-#   instance of the program.)
+# Client stuff logs instead of printing, so writing many strings doesn't do
+#   console I/O for each one.  (We are usually operating without a log file
+#   because we are not the primary instance of the program, so LOGGER's
+#   NullHandler drops these messages.)
 
 @debug_fxn
 def client_connect_to_pipe(pipe_name):
-    """Connect to server pipe.  Keep trying if pipe is busy.
+    """Connect to server pipe.  Keep trying if pipe is busy, up to
+    CONNECT_RETRIES times.
 
     Args:
         pipe_name (str): name of named pipe
 
     Returns:
         PyHANDLE: pipe handle
+
+    Raises:
+        pywintypes.error: on any error, or if pipe is still busy after
+            CONNECT_RETRIES tries
     """
-    no_connection = True
-    while no_connection:
+    for retry in range(CONNECT_RETRIES):
         try:
             handle = win32file.CreateFile(
                 pipe_name,
@@ -273,29 +457,31 @@ def client_connect_to_pipe(pipe_name):
                 None
             )
         except pywintypes.error as err:
-            (winerror, funcname, strerror) = err.args
-            if winerror == 231:
-                # ERROR_PIPE_BUSY
-                print("Pipe busy, trying again after 10ms")
-                time.sleep(10e-3)
-
-            print("Windows error:\n    %s\n   %s\n    %s",
-                    winerror, funcname, strerror
-                    )
+            if err.winerror == ERROR_PIPE_BUSY and retry < CONNECT_RETRIES - 1:
+                # wait in kernel until a pipe instance is free, then try
+                #   again.  (Raises if none frees up before timeout.)
+                LOGGER.debug("Pipe busy, waiting to try again")
+                win32pipe.WaitNamedPipe(pipe_name, PIPE_BUSY_TIMEOUT_MS)
+                continue
+
+            log_win_error(err)
             raise
         else:
-            no_connection = False
+            return handle
 
-    return handle
-
-def pipe_write(pipe_handle, data_string):
-    """Write encoded bytes to pipe (using utf-8) from string
+def pipe_write(pipe_handle, data):
+    """Write encoded bytes to pipe (using utf-8) from string, or write bytes
+    directly.
 
     Args:
         pipe_handle (PyHANDLE): pipe handle to read from
-        data_string (str): string to write to pipe
+        data (str or bytes): string to write to pipe, or already-encoded
+            utf-8 bytes
     """
-    data_bytes = data_string.encode(encoding='utf-8')
+    if isinstance(data, (bytes, bytearray)):
+        data_bytes = data
+    else:
+        (data_bytes, _) = _UTF8_ENCODE(data)
     win32file.WriteFile(
             # handle to Named Pipe
             pipe_handle,
@@ -303,6 +489,62 @@ def pipe_write(pipe_handle, data_string):
             data_bytes
             )
 
+class ClientPipe:
+    """Context manager: client connection to server pipe, kept open for
+    any number of writes.
+
+    Example:
+        with ClientPipe(pipe_name) as client_pipe:
+            client_pipe.write("string 1")
+            client_pipe.write("string 2")
+    """
+    @debug_fxn
+    def __init__(self, pipe_name):
+        """Initialize
+
+        Args:
+            pipe_name (str): name of named pipe
+        """
+        self.pipe_name = pipe_name
+        self.pipe_handle = None
+
+    @debug_fxn
+    def __enter__(self):
+        self.pipe_handle = client_connect_to_pipe(self.pipe_name)
+        LOGGER.debug("Client Connected to pipe.")
+        return self
+
+    @debug_fxn
+    def __exit__(self, exc_type, exc_value, traceback):
+        win32file.CloseHandle(self.pipe_handle)
+        self.pipe_handle = None
+
+    def write(self, data_string):
+        """Write string to server as one message
+
+        Server reads in message mode, so each write stays a separate
+        message without needing to flush after each one.
+
+        Args:
+            data_string (str or bytes): string to write to pipe, or
+                already-encoded utf-8 bytes
+        """
+        pipe_write(self.pipe_handle, data_string)
+        LOGGER.debug("Wrote: %s", data_string)
+
+    def write_strings(self, data_strings):
+        """Write many strings to server in one message, separated by
+        MSG_SEPARATOR, using a single WriteFile.
+
+        Strings must not contain MSG_SEPARATOR (true for file paths).
+
+        Args:
+            data_strings (list): list of strings to write to pipe
+        """
+        if not data_strings:
+            return
+        self.write(MSG_SEPARATOR.join(data_strings))
+
 @debug_fxn
 def client_write_strings(pipe_name, data_strings):
     """Write strings to a named pipe as a pipe client
@@ -313,26 +555,20 @@ def client_write_strings(pipe_name, data_strings):
     Returns:
         bool: True on success, False on failure.
     """
+    # don't connect to pipe at all if there's nothing to send
+    data_strings = [x for x in data_strings if x]
+    if not data_strings:
+        return True
+
     try:
-        pipe_handle = client_connect_to_pipe(pipe_name)
+        with ClientPipe(pipe_name) as client_pipe:
+            # send all filenames to pipe in one write
+            client_pipe.write_strings(data_strings)
     except pywintypes.error as err:
-        (winerror, _funcname, _strerror) = err.args
-        if winerror == 2:
-            print("Error: No pipe server.")
+        if err.winerror == ERROR_FILE_NOT_FOUND:
+            LOGGER.warning("No pipe server.")
             return False
         raise
-    print("Client Connected to pipe.")
-    # send filenames to pipe
-    for data_string in data_strings:
-        pipe_write(pipe_handle, data_string)
-        print("Wrote: %s"%data_string)
-        # sometimes writing these in very fast sequence can make read server
-        #   interpret two data_strings as one message.
-        # Flush write file buffers to ensure we write this message
-        win32file.FlushFileBuffers(pipe_handle)
-
-    # Close Handle
-    win32file.CloseHandle(pipe_handle)
 
     return True
 
@@ -347,37 +583,36 @@ def pipe_server(pipe_name):
     Args:
         pipe_name (str): name of Windows named pipe
     """
-    print("pipe server")
+    LOGGER.debug("pipe server")
     client_done = False
 
     pipe = server_create_named_pipe(pipe_name)
-    print("waiting for client")
-    server_connect_and_wait(pipe)
-    print("got client")
+    overlapped = new_overlapped()
+    read_buf = win32file.AllocateReadBuffer(PIPE_BUFFER_SIZE)
+    LOGGER.debug("waiting for client")
+    server_connect_and_wait(pipe, overlapped)
+    LOGGER.debug("got client")
 
     while not client_done:
         try:
-            resp_str = pipe_read(pipe)
-            print(f"message: {resp_str}")
+            resp_str = pipe_read(pipe, read_buf, overlapped)
+            LOGGER.debug("message: %s", resp_str)
         except pywintypes.error as err:
-            (winerror, funcname, strerror) = err.args
-            if winerror == 109:
-                print("Client closed access to pipe.")
-                print("    {0}".format(winerror))
-                print("    {0}".format(funcname))
-                print("    {0}".format(strerror))
+            if err.winerror == ERROR_BROKEN_PIPE:
+                LOGGER.debug(
+                        "Client closed access to pipe.\n    %s\n    %s\n    %s",
+                        err.winerror, err.funcname, err.strerror
+                        )
                 client_done = True
             else:
-                LOGGER.error("Windows error:\n    %s\n   %s\n    %s",
-                        winerror, funcname, strerror
-                        )
+                log_win_error(err)
                 client_done = True
                 raise
         finally:
             if client_done:
                 win32file.CloseHandle(pipe)
 
-    print("finished now")
+    LOGGER.debug("finished now")
 
 @debug_fxn
 def pipe_client(pipe_name):
@@ -386,62 +621,55 @@ def pipe_client(pipe_name):
     Args:
         pipe_name (str): name of Windows named pipe
     """
-    print("pipe client")
+    LOGGER.debug("pipe client")
     pipe_quit = False
 
     try:
         handle = client_connect_to_pipe(pipe_name)
     except pywintypes.error as err:
-        (winerror, funcname, strerror) = err.args
-        if winerror == 2:
-            print("No pipe server.")
+        if err.winerror == ERROR_FILE_NOT_FOUND:
+            LOGGER.debug("No pipe server.")
             return
         raise
 
-    print("Client Connected to pipe.")
+    LOGGER.debug("Client Connected to pipe.")
+
+    # encode all messages once, before writing any
+    messages = [b"count: %d"%count for count in range(5)]
 
     while not pipe_quit:
         try:
-            for count in range(5):
-                pipe_write(handle, f"count: {count}")
+            for message in messages:
+                pipe_write(handle, message)
                 time.sleep(1)
             pipe_quit = True
         except pywintypes.error as err:
-            (winerror, funcname, strerror) = err.args
-            if winerror == 2:
-                # ERROR_FILE_NOT_FOUND
-                #   The system cannot find the file specified
-                print("no pipe, trying again in a sec")
-                print("    {0}".format(winerror))
-                print("    {0}".format(funcname))
-                print("    {0}".format(strerror))
+            if err.winerror == ERROR_FILE_NOT_FOUND:
+                # The system cannot find the file specified
+                log_msg = "no pipe, trying again in a sec"
                 time.sleep(1)
-            elif winerror == 109:
-                # ERROR_BROKEN_PIPE
-                #   The pipe has been ended.
-                print("broken pipe, bye bye")
-                print("    {0}".format(winerror))
-                print("    {0}".format(funcname))
-                print("    {0}".format(strerror))
+            elif err.winerror == ERROR_BROKEN_PIPE:
+                # The pipe has been ended.
+                log_msg = "broken pipe, bye bye"
                 pipe_quit = True
-            elif winerror == 232:
-                # ERROR_NO_DATA
-                #   The pipe is being closed.
-                print("broken pipe, bye bye")
-                print("    {0}".format(winerror))
-                print("    {0}".format(funcname))
-                print("    {0}".format(strerror))
+            elif err.winerror == ERROR_NO_DATA:
+                # The pipe is being closed.
+                log_msg = "broken pipe, bye bye"
                 pipe_quit = True
             else:
-                print("Windows error:")
-                print("    {0}".format(winerror))
-                print("    {0}".format(funcname))
-                print("    {0}".format(strerror))
+                log_msg = "Windows error:"
+            LOGGER.debug(
+                    log_msg + "\n    %s\n    %s\n    %s",
+                    err.winerror, err.funcname, err.strerror
+                    )
 
 
 if __name__ == '__main__':
     PIPE_NAME_TEST = r'\\.\pipe\Marcam-username'
 
+    # show test server/client messages on console
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
+
     if len(sys.argv) < 2:
         print("need s or c as argument")
     elif sys.argv[1] == "s":
@@ -2,30 +2,23 @@
 
 # generate colormap python code for colormaps.py
 
+import sys
+
+import numpy as np
+
 import colormaps
 
 def print_array(data_array):
-    for i in range(int(len(data_array)/4)):
-        print("    [ %d, %d, %d],"%(
-            round(data_array[i*4][0]*255),
-            round(data_array[i*4][1]*255),
-            round(data_array[i*4][2]*255)
-            ), end="")
-        print(" [ %d, %d, %d],"%(
-            round(data_array[i*4+1][0]*255),
-            round(data_array[i*4+1][1]*255),
-            round(data_array[i*4+1][2]*255)
-            ), end="")
-        print(" [ %d, %d, %d],"%(
-            round(data_array[i*4+2][0]*255),
-            round(data_array[i*4+2][1]*255),
-            round(data_array[i*4+2][2]*255)
-            ), end="")
-        print(" [ %d, %d, %d],"%(
-            round(data_array[i*4+3][0]*255),
-            round(data_array[i*4+3][1]*255),
-            round(data_array[i*4+3][2]*255)
-            ))
+    # scale/round all entries at once, then write every row in one call
+    #   (numpy round, like python round, rounds halves to even)
+    int_array = (np.asarray(data_array) * 255).round().astype(np.uint8)
+    lines = [
+            "    [ %d, %d, %d], [ %d, %d, %d], [ %d, %d, %d], [ %d, %d, %d],"%(
+                tuple(row)
+                )
+            for row in int_array.reshape(-1, 12).tolist()
+            ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 print("MAGMA_DATA = np.array([")
 print_array(colormaps.MAGMA_DATA)
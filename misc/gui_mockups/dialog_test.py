@@ -55,10 +55,13 @@ class MainWindow(wx.Frame):
         #dialog.Hide()
         #dialog.ShowModal()
 
-        wx.CallLater(1000, print, "Disable")
-        wx.CallLater(1000, self.Enable, False)
-        wx.CallLater(3000, print, "Enable")
-        wx.CallLater(3000, self.Enable, True)
+        # one timer per time, each doing both actions
+        wx.CallLater(1000, self.set_enable, False)
+        wx.CallLater(3000, self.set_enable, True)
+
+    def set_enable(self, enable):
+        print("Enable" if enable else "Disable")
+        self.Enable(enable)
 
 def main():
     my_app = wx.App()
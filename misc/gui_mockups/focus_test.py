@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 
 import wx
- 
+
+
 class MyForm(wx.Frame):
  
     def __init__(self):
@@ -12,16 +13,37 @@ class MyForm(wx.Frame):
         panel.Bind(wx.EVT_SET_FOCUS, self.onFocus)
         txt = wx.StaticText(panel, wx.ID_ANY, 
                    "This label cannot receive focus")
- 
-        self.timer = wx.Timer(self)
-        self.Bind(wx.EVT_TIMER, self.onTimer)
-        self.timer.Start(1000)
+
+        # track focus changes by event instead of polling FindFocus()
+        self.last_focus = None
+        self.Bind(wx.EVT_ACTIVATE, self.onActivate)
+        self.bindFocusTree(self)
+
+    def bindFocusTree(self, window):
+        window.Bind(wx.EVT_SET_FOCUS, self.onAnyFocus)
+        for child in window.GetChildren():
+            self.bindFocusTree(child)
  
     def onFocus(self, event):
         print("panel received focus!")
- 
-    def onTimer(self, evt):
-        print('Focused window:', wx.Window.FindFocus())
+        event.Skip()
+
+    def onAnyFocus(self, evt):
+        evt.Skip()
+        self.printFocus(evt.GetEventObject())
+
+    def onActivate(self, evt):
+        evt.Skip()
+        if evt.GetActive():
+            self.printFocus(wx.Window.FindFocus())
+        else:
+            self.printFocus(None)
+
+    def printFocus(self, window):
+        # only print transitions
+        if window is not self.last_focus:
+            self.last_focus = window
+            print('Focused window:', window)
  
 # Run the program
 if __name__ == "__main__":
@@ -2,117 +2,6 @@
 
 import sys
 import argparse
-import os.path
-import wx
-
-
-class MainWindow(wx.Frame):
-    def __init__(self, srcfiles, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-
-        self.mark_mode = False
-        self.marktool = None
-        self.save_filepath = None
-        # this can be set to false by child by change in state
-        self.content_saved = True
-
-        self.init_ui()
-        if srcfiles:
-            # TODO: are we able to load more than one file?
-            self.load_image_from_path(srcfiles[0])
-
-    def init_ui(self):
-        # menu bar stuff
-        menubar = wx.MenuBar()
-        # File
-        file_menu = wx.Menu()
-        fitem = file_menu.Append(wx.ID_EXIT,
-                'Quit', 'Quit application\tCtrl+Q')
-        oitem = file_menu.Append(wx.ID_OPEN,
-                'Open...\tCtrl+O', 'Open')
-        citem = file_menu.Append(wx.ID_CLOSE,
-                'Close\tCtrl+W', 'Close')
-        sitem = file_menu.Append(wx.ID_SAVE,
-                'Save\tCtrl+S', 'Save')
-        saitem = file_menu.Append(wx.ID_SAVEAS,
-                'Save As...\tShift+Ctrl+S', 'Save As')
-        menubar.Append(file_menu, '&File')
-        # Tools
-        tools_menu = wx.Menu()
-        self.markmodeitem = tools_menu.Append(wx.ID_ANY, "&Enable Mark Mode\tCtrl+M")
-        menubar.Append(tools_menu, "&Tools")
-
-        self.SetMenuBar(menubar)
-
-        # toolbar stuff
-        self.toolbar = self.CreateToolBar()
-        obmp = os.path.join(".", 'topen32.png')
-        otool = self.toolbar.AddTool(wx.ID_OPEN, 'Open', wx.Bitmap(obmp))
-        markbmp = os.path.join(".", 'marktool32.png')
-        self.marktool = self.toolbar.AddCheckTool(
-                wx.ID_ANY,
-                'Point/Mark',
-                wx.Bitmap(markbmp),
-                )
-        self.mark_id = self.marktool.GetId()
-        self.toolbar.Realize()
-
-        # status bar stuff
-        self.statusbar = self.CreateStatusBar()
-        self.statusbar.SetStatusText('Ready.')
-
-        # Panel keeps things from spilling over the frame, statusbar, etc.
-        #   also accepts key focus
-        #   probably with more than one Panel we need to worry about which
-        #       has keyboard focus
-
-        # expand img_panel to fill space
-        mybox = wx.BoxSizer(wx.VERTICAL)
-
-        # ImageScrolledCanvas is the cleanest, probably most portable
-        #self.img_panel = ImageScrolledCanvas(self)
-
-        #mybox.Add(self.img_panel, 1, wx.EXPAND)
-        self.SetSizer(mybox)
-
-        # setup event handlers for toolbar, menus
-        self.Bind(wx.EVT_TOOL, self.on_open, otool)
-        self.Bind(wx.EVT_TOOL, self.on_markmode_toggle, self.marktool)
-
-        self.Bind(wx.EVT_MENU, self.on_quit, fitem)
-        self.Bind(wx.EVT_MENU, self.on_open, oitem)
-        self.Bind(wx.EVT_MENU, self.on_markmode_toggle, self.markmodeitem)
-
-        # finally render app
-        self.SetSize((800, 600))
-        self.SetTitle('wx Test Window')
-        self.Centre()
-
-        self.Show(True)
-
-    def on_open(self, evt):
-        print("Open!!")
-
-    def on_quit(self, evt):
-        self.Close()
-
-    def on_key_down(self, evt):
-        KeyCode = evt.GetKeyCode()
-        evt.Skip()
-
-    def on_markmode_toggle(self, evt):
-        # toggle state
-        self.mark_mode = not self.mark_mode
-        # update toolbartoolbase
-        # update menu item
-        if self.mark_mode:
-            self.markmodeitem.SetItemLabel("Disable &Mark Mode\tCtrl+M")
-            self.toolbar.ToggleTool(self.mark_id, True) # works!
-            #self.marktool.Toggle(True) # toggles state but not bitmap!
-        else:
-            self.markmodeitem.SetItemLabel("Enable &Mark Mode\tCtrl+M")
-            self.toolbar.ToggleTool(self.mark_id, False) # works!
-            # self.marktool.Toggle(False) # toggles state but not bitmap!
 
 
 def process_command_line(argv):
@@ -155,6 +44,11 @@ def main(argv=None):
     #   of the application icon to start the icon
     args = process_command_line(argv)
 
+    # import wx only now, so --help and command-line errors return without
+    #   paying for loading wx
+    import wx
+    from wxtest_window import MainWindow
+
     # setup main wx event loop
     myapp = wx.App()
     main_win = MainWindow(args.srcfiles, None)
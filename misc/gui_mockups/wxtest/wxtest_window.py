@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+
+# MainWindow for wxtest.py, kept separate so wxtest.py can parse its command
+#   line without importing wx
+
+import os.path
+import wx
+
+
+OPEN_BMP_PATH = os.path.join(".", 'topen32.png')
+MARK_BMP_PATH = os.path.join(".", 'marktool32.png')
+
+# decoded toolbar bitmaps, shared by all windows
+_BITMAP_CACHE = {}
+
+def _bmp(path):
+    """Return wx.Bitmap for path, decoding file only the first time."""
+    if path not in _BITMAP_CACHE:
+        _BITMAP_CACHE[path] = wx.Bitmap(path)
+    return _BITMAP_CACHE[path]
+
+
+class MainWindow(wx.Frame):
+    # Tools menu labels for mark mode item
+    LABEL_MARK_ENABLE = "&Enable Mark Mode\tCtrl+M"
+    LABEL_MARK_DISABLE = "Disable &Mark Mode\tCtrl+M"
+
+    def __init__(self, srcfiles, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.mark_mode = False
+        self.marktool = None
+        self.save_filepath = None
+        # this can be set to false by child by change in state
+        self.content_saved = True
+
+        self.init_ui()
+        if srcfiles:
+            # TODO: are we able to load more than one file?
+            self.load_image_from_path(srcfiles[0])
+
+    def init_ui(self):
+        # menu bar stuff
+        menubar = wx.MenuBar()
+        # File
+        file_menu = wx.Menu()
+        fitem = file_menu.Append(wx.ID_EXIT,
+                'Quit', 'Quit application\tCtrl+Q')
+        oitem = file_menu.Append(wx.ID_OPEN,
+                'Open...\tCtrl+O', 'Open')
+        citem = file_menu.Append(wx.ID_CLOSE,
+                'Close\tCtrl+W', 'Close')
+        sitem = file_menu.Append(wx.ID_SAVE,
+                'Save\tCtrl+S', 'Save')
+        saitem = file_menu.Append(wx.ID_SAVEAS,
+                'Save As...\tShift+Ctrl+S', 'Save As')
+        menubar.Append(file_menu, '&File')
+        # Tools
+        tools_menu = wx.Menu()
+        self.markmodeitem = tools_menu.Append(wx.ID_ANY, self.LABEL_MARK_ENABLE)
+        menubar.Append(tools_menu, "&Tools")
+
+        self.SetMenuBar(menubar)
+
+        # toolbar stuff
+        self.toolbar = self.CreateToolBar()
+        otool = self.toolbar.AddTool(wx.ID_OPEN, 'Open', _bmp(OPEN_BMP_PATH))
+        self.marktool = self.toolbar.AddCheckTool(
+                wx.ID_ANY,
+                'Point/Mark',
+                _bmp(MARK_BMP_PATH),
+                )
+        self.mark_id = self.marktool.GetId()
+        self.toolbar.Realize()
+
+        # status bar stuff
+        self.statusbar = self.CreateStatusBar()
+        self.statusbar.SetStatusText('Ready.')
+
+        # Panel keeps things from spilling over the frame, statusbar, etc.
+        #   also accepts key focus
+        #   probably with more than one Panel we need to worry about which
+        #       has keyboard focus
+
+        # expand img_panel to fill space
+        mybox = wx.BoxSizer(wx.VERTICAL)
+
+        # ImageScrolledCanvas is the cleanest, probably most portable
+        #self.img_panel = ImageScrolledCanvas(self)
+
+        #mybox.Add(self.img_panel, 1, wx.EXPAND)
+        self.SetSizer(mybox)
+
+        # setup event handlers for toolbar, menus
+        bindings = (
+                (wx.EVT_TOOL, self.on_open, otool),
+                (wx.EVT_TOOL, self.on_markmode_toggle, self.marktool),
+                (wx.EVT_MENU, self.on_quit, fitem),
+                (wx.EVT_MENU, self.on_open, oitem),
+                (wx.EVT_MENU, self.on_markmode_toggle, self.markmodeitem),
+                )
+        for (event, handler, source) in bindings:
+            self.Bind(event, handler, source)
+
+        # finally render app
+        self.SetSize((800, 600))
+        self.SetTitle('wx Test Window')
+        self.Centre()
+
+        self.Show(True)
+
+    def on_open(self, evt):
+        print("Open!!")
+
+    def on_quit(self, evt):
+        self.Close()
+
+    def on_key_down(self, evt):
+        KeyCode = evt.GetKeyCode()
+        evt.Skip()
+
+    def on_markmode_toggle(self, evt):
+        # toggle state
+        self.mark_mode = not self.mark_mode
+        # update menu item
+        self.markmodeitem.SetItemLabel(
+                self.LABEL_MARK_DISABLE if self.mark_mode
+                else self.LABEL_MARK_ENABLE
+                )
+        # update toolbartoolbase
+        self.toolbar.ToggleTool(self.mark_id, self.mark_mode) # works!
+        #self.marktool.Toggle(self.mark_mode) # toggles state but not bitmap!
@@ -0,0 +1,28 @@
+#!/usr/bin/env/python3
+
+# Copyright 2018 Matthew A. Clapp
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+
+@pytest.fixture(scope='session', autouse=True)
+def wxapp():
+    """One wx.App for the whole test session, necessary for using some wx
+    functions.
+
+    False: don't redirect stdout/stderr to a window.
+    """
+    import wx
+    return wx.App(False)
@@ -7,13 +7,23 @@ import matplotlib.pyplot as plt
 import matplotlib
 import matplotlib.cm
 
-def rgb_from_array(input_array, cmap='gray'):
-    if cmap=='gray':
-        image_rgba = matplotlib.cm.gray(input_array)
-    else:
-        image_rgba = matplotlib.cm.cmaps_listed[cmap](input_array)
+# 256-entry RGBA uint8 lookup table for each colormap, computed once
+_LUT_CACHE = {}
+
+def _lut(cmap):
+    if cmap not in _LUT_CACHE:
+        if cmap=='gray':
+            colormap = matplotlib.cm.gray
+        else:
+            colormap = matplotlib.cm.cmaps_listed[cmap]
+        _LUT_CACHE[cmap] = np.round(
+                colormap(np.arange(256)) * 255
+                ).astype(np.uint8)
+    return _LUT_CACHE[cmap]
 
-    return np.round(image_rgba * 255).astype(np.uint8)
+def rgb_from_array(input_array, cmap='gray'):
+    # input_array is integer 0-255, so just index colormap's lookup table
+    return _lut(cmap)[input_array]
 
 def read_print_imfile(imfilename):
     test_img_invert_load = plt.imread(imfilename)
@@ -27,9 +37,11 @@ def read_print_imfile(imfilename):
             print("")
 
 def main():
-    ascending = [list(range(0,256))]*20
-    descending = [list(range(255,-1,-1))]*20
-    test_img_array = np.array(ascending + descending + ascending + descending)
+    # build in numpy directly: 20 rows ascending 0-255, 20 rows descending,
+    #   repeated.  (uint8 values still index colormaps directly, like ints.)
+    ascending = np.broadcast_to(np.arange(256, dtype=np.uint8), (20, 256))
+    descending = ascending[:, ::-1]
+    test_img_array = np.vstack((ascending, descending, ascending, descending))
 
     plt.imsave('test_gray.png', rgb_from_array(test_img_array))
 
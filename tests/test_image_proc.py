@@ -14,6 +14,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import binascii
+from functools import lru_cache
 import pathlib
 import pytest
 
@@ -32,29 +34,45 @@ TESTDATA_IMAGEPROC = TESTDATA_PATH / 'image_proc'
 TEST_INPUT_IMAGE = TESTDATA_IMAGEPROC / 'test_gray.png'
 
 
-# necessary for using some wx functions
-app = wx.App()
+@pytest.fixture(scope='module')
+def input_image():
+    """TEST_INPUT_IMAGE, decoded only once for all tests in this module"""
+    return wx.Image(str(TEST_INPUT_IMAGE))
 
+def _chan0(wx_image):
+    """Return first (red) channel of wx.Image data as a numpy uint8 array,
+    viewing image data buffer instead of copying it.
+    """
+    return np.frombuffer(wx_image.GetData(), dtype=np.uint8)[::3]
 
-def image_same(wx_image_ref, wx_image_test):
-    wx_image_ref_data = wx_image_ref.GetData()[::3]
-    wx_image_test_data = wx_image_test.GetData()[::3]
+@lru_cache(maxsize=None)
+def _ref_chan0(path_str):
+    """Return first (red) channel of reference image file as a numpy uint8
+    array, loading each reference image only once per test session.
 
-    test_result = wx_image_ref_data == wx_image_test_data
+    Copied so the cached array does not depend on the wx.Image buffer.
+    """
+    return _chan0(wx.Image(path_str)).copy()
+
+def image_same(ref_path_str, wx_image_test):
+    wx_image_ref_data = _ref_chan0(ref_path_str)
+    wx_image_test_data = _chan0(wx_image_test)
+
+    test_result = np.array_equal(wx_image_ref_data, wx_image_test_data)
 
     if not test_result:
-        for i in range(int(len(wx_image_test_data)/16)):
-            print("ref: ", end="")
-            for j in range(16):
-                byte = wx_image_ref_data[i*16 + j]
-                print("%02x"%byte, end=" ")
-            print("")
-            print("tst: ", end="")
-            for j in range(16):
-                byte = wx_image_test_data[i*16 + j]
-                print("%02x"%byte, end=" ")
-            print("")
-        print("")
+        # hex dump of ref and test data, 16 bytes per line
+        ref_bytes = wx_image_ref_data.tobytes()
+        test_bytes = wx_image_test_data.tobytes()
+        dump_lines = []
+        for i in range(0, len(test_bytes) - 15, 16):
+            dump_lines.append(
+                    "ref: " + binascii.hexlify(ref_bytes[i:i+16], ' ').decode()
+                    )
+            dump_lines.append(
+                    "tst: " + binascii.hexlify(test_bytes[i:i+16], ' ').decode()
+                    )
+        print("\n".join(dump_lines) + "\n")
 
     return test_result
 
@@ -88,25 +106,26 @@ def test_pilimage2wximage():
 
 def test_image_invert():
     test_input = wx.Image(str(TEST_INPUT_IMAGE))
-    correct_output = wx.Image(str(TESTDATA_IMAGEPROC / 'test_gray_invert.png' ))
     test_output = image_proc.image_invert(test_input)
-    assert image_same(correct_output, test_output)
+    assert image_same(
+            str(TESTDATA_IMAGEPROC / 'test_gray_invert.png'), test_output
+            )
 
 @pytest.mark.skip(reason="Empty test")
 def test_image_autocontrast():
     pass
 
-def test_image_remap_colormap():
-    for colormap in ['viridis', 'plasma', 'inferno', 'magma']:
-        test_input = wx.Image(str(TEST_INPUT_IMAGE))
-        correct_output = wx.Image(
-                str(TESTDATA_IMAGEPROC / ('test_%s.png'%colormap))
-                )
-        test_output = image_proc.image_remap_colormap(
-                test_input,
-                cmap=colormap
-                )
-        assert image_same(correct_output, test_output)
+@pytest.mark.parametrize('colormap', ['viridis', 'plasma', 'inferno', 'magma'])
+def test_image_remap_colormap(input_image, colormap):
+    # copy shared input image, in case it gets modified
+    test_input = input_image.Copy()
+    test_output = image_proc.image_remap_colormap(
+            test_input,
+            cmap=colormap
+            )
+    assert image_same(
+            str(TESTDATA_IMAGEPROC / ('test_%s.png'%colormap)), test_output
+            )
 
 @pytest.mark.skip(reason="Empty test")
 def test_get_image_info():
@@ -14,15 +14,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import io
 import json
+import os
 import pathlib
+import pytest
+import shutil
+import struct
 import wx
 import zipfile
 
 import mcmfile
 
 # current MCM file version
-MCM_FILE_VERSION = '1.0.0'
+MCM_FILE_VERSION = '1.1.0'
 
 # the parent of this file is the tests directory
 TESTS_PATH = pathlib.Path(__file__).resolve().parent
@@ -33,45 +38,105 @@ TESTDATA_PATH = TESTS_PATH / 'testdata'
 TIFF_FILE = TESTDATA_PATH / 'test1_ref.tif'
 LEGACY_MCM_1SC_FILE = TESTDATA_PATH / 'legacy_mcm_1sc_A11 2015-12-15 11hr 55min.mcm'
 MCM_1_0_FILE = TESTDATA_PATH / 'single_pixel_lines.mcm'
+CHECKERBOARD_MCM_FILE = TESTDATA_PATH / 'checkerboard.mcm'
 
-# test save files
-SAVE_MCM_FILEPATH = TESTDATA_PATH / 'test_save_file.mcm'
+# test save file name (saved in pytest's tmp_path)
+SAVE_MCM_FILENAME = 'test_save_file.mcm'
 
-def test_is_valid_legacy():
-    assert mcmfile.is_valid(LEGACY_MCM_1SC_FILE) is True
+@pytest.mark.parametrize(
+        'mcm_path', [LEGACY_MCM_1SC_FILE, MCM_1_0_FILE, CHECKERBOARD_MCM_FILE]
+        )
+def test_is_valid(mcm_path):
+    assert mcmfile.is_valid(mcm_path) is True
 
-def test_is_valid_mcm_1_0_file():
-    assert mcmfile.is_valid(MCM_1_0_FILE) is True
-
-def test_load_legacy_mcm_file():
-    # legacy mcm file
-    (wx_image, marks, img_name) = mcmfile.load(LEGACY_MCM_1SC_FILE)
-    assert wx_image.IsOk()
-    assert isinstance(marks, list)
-    assert isinstance(img_name, str)
-
-def test_load_mcm_1_0_file():
-    # legacy mcm file
-    (wx_image, marks, img_name) = mcmfile.load(MCM_1_0_FILE)
+@pytest.mark.parametrize('mcm_path', [LEGACY_MCM_1SC_FILE, MCM_1_0_FILE])
+def test_load(mcm_path):
+    (wx_image, marks, img_name) = mcmfile.load(mcm_path)
     assert wx_image.IsOk()
     assert isinstance(marks, list)
     assert isinstance(img_name, str)
 
-def test_save():
-    app = wx.App()
+def test_save(tmp_path):
+    save_mcm_filepath = tmp_path / SAVE_MCM_FILENAME
     test_img = wx.Image(str(TIFF_FILE))
     test_marks = [(1,4), (2,10), (20,5)]
-    save_returnval = mcmfile.save(str(SAVE_MCM_FILEPATH), test_img, test_marks)
+    save_returnval = mcmfile.save(str(save_mcm_filepath), test_img, test_marks)
     assert save_returnval
-    assert zipfile.is_zipfile(str(SAVE_MCM_FILEPATH))
-    with zipfile.ZipFile(SAVE_MCM_FILEPATH, 'r') as test_open_fh:
+    assert zipfile.is_zipfile(str(save_mcm_filepath))
+    with zipfile.ZipFile(save_mcm_filepath, 'r') as test_open_fh:
         with test_open_fh.open(mcmfile.MCM_INFO_NAME, 'r') as info_fh:
             info = json.load(info_fh)
-        test_open_fh.extract(info['mcm_image_name'])
+        png_data = test_open_fh.read(info['mcm_image_name'])
+        marks_data = test_open_fh.read(info['mcm_marks_name'])
     assert info.get('mcm_version', None) == MCM_FILE_VERSION 
-    assert [tuple(x) for x in info['marks']] == test_marks
-    assert wx.Image(info['mcm_image_name'], type=wx.BITMAP_TYPE_PNG)
+    assert info['marks_count'] == len(test_marks)
+    # marks list kept in info.json for readers of 1.0.0 files
+    assert info['marks'] == [list(x) for x in test_marks]
+    assert marks_data == struct.pack('<6i', 1, 4, 2, 10, 20, 5)
+    assert mcmfile.load(save_mcm_filepath)[1] == test_marks
+    assert wx.Image(io.BytesIO(png_data), type=wx.BITMAP_TYPE_PNG).IsOk()
+
+def test_load_corrupt_marks(tmp_path):
+    save_mcm_filepath = tmp_path / SAVE_MCM_FILENAME
+    test_img = wx.Image(str(TIFF_FILE))
+    assert mcmfile.save(str(save_mcm_filepath), test_img, [(1,4)])
+    with zipfile.ZipFile(save_mcm_filepath, 'r') as test_open_fh:
+        members = {x: test_open_fh.read(x) for x in test_open_fh.namelist()}
+    # truncated marks data
+    members[mcmfile.MCM_MARKS_NAME] = members[mcmfile.MCM_MARKS_NAME][:5]
+    with zipfile.ZipFile(save_mcm_filepath, 'w') as test_open_fh:
+        for (name, data) in members.items():
+            test_open_fh.writestr(name, data)
+    with pytest.raises(mcmfile.McmFileError):
+        mcmfile.load(save_mcm_filepath)
+
+def test_save_marks_only(tmp_path):
+    save_mcm_filepath = tmp_path / SAVE_MCM_FILENAME
+    test_img = wx.Image(str(TIFF_FILE))
+    assert mcmfile.save(str(save_mcm_filepath), test_img, [(1,4)])
+    with zipfile.ZipFile(save_mcm_filepath, 'r') as test_open_fh:
+        image_data = test_open_fh.read(mcmfile.MCM_IMAGE_NAME)
+
+    test_marks = [(2,10), (20,5)]
+    assert mcmfile.save_marks_only(save_mcm_filepath, test_marks)
+    with zipfile.ZipFile(save_mcm_filepath, 'r') as test_open_fh:
+        assert test_open_fh.read(mcmfile.MCM_IMAGE_NAME) == image_data
+    assert mcmfile.load(save_mcm_filepath)[1] == test_marks
+
+def test_save_marks_only_changed_file(tmp_path):
+    save_mcm_filepath = tmp_path / SAVE_MCM_FILENAME
+    test_img = wx.Image(str(TIFF_FILE))
+    assert mcmfile.save(str(save_mcm_filepath), test_img, [(1,4)])
+    (mtime_ns, size) = mcmfile.file_signature(save_mcm_filepath)
+    # signature from before file was changed by someone else
+    old_file_sig = (mtime_ns - 1, size)
+    assert mcmfile.save_marks_only(
+            save_mcm_filepath, [(2,10)], file_sig=old_file_sig
+            ) is False
+    assert mcmfile.load(save_mcm_filepath)[1] == [(1,4)]
+
+def test_save_marks_only_unwritable_dir(tmp_path):
+    save_dir = tmp_path / 'read_only'
+    save_dir.mkdir()
+    save_mcm_filepath = save_dir / SAVE_MCM_FILENAME
+    test_img = wx.Image(str(TIFF_FILE))
+    assert mcmfile.save(str(save_mcm_filepath), test_img, [(1,4)])
+    # existing file is still writable, but no new file can be made in dir
+    save_dir.chmod(0o555)
+    try:
+        if os.access(str(save_dir), os.W_OK):
+            pytest.skip("Can't make dir read-only (e.g. running as root)")
+        assert mcmfile.save_marks_only(save_mcm_filepath, [(2,10)]) is False
+    finally:
+        save_dir.chmod(0o755)
+
+def test_save_marks_only_missing_dir(tmp_path):
+    # no dir to make new file in, same error path as unwritable dir
+    save_mcm_filepath = tmp_path / 'missing_dir' / SAVE_MCM_FILENAME
+    assert mcmfile.save_marks_only(save_mcm_filepath, [(2,10)]) is False
 
-    # delete test save files
-    SAVE_MCM_FILEPATH.unlink()
-    pathlib.Path(info['mcm_image_name']).unlink()
+def test_save_marks_only_legacy(tmp_path):
+    # legacy files can't be updated in place, caller must save whole file
+    legacy_filepath = tmp_path / LEGACY_MCM_1SC_FILE.name
+    shutil.copy(str(LEGACY_MCM_1SC_FILE), str(legacy_filepath))
+    assert mcmfile.save_marks_only(legacy_filepath, [(1,4)]) is False